@@ -3,27 +3,188 @@ CITYARRAY City Data Integration
 Weather, Air Quality, NWS Alerts
 """
 
+import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Optional streaming parser: NWS alert lists can run to megabytes during
+# severe weather, and only the first few features are used
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Free API keys - sign up at:
 # https://openweathermap.org/api (weather)
 # https://docs.airnowapi.org/ (air quality - free for gov)
 
-OPENWEATHER_KEY = fd9375b142b3e1233b7b2aa0160762b5"  # Get free key
+OPENWEATHER_KEY = "fd9375b142b3e1233b7b2aa0160762b5"  # Get free key
+
+# Shared session so repeated polls (and all CityData instances) reuse
+# TCP/TLS connections
+_POOL_MAXSIZE = 8
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "CITYARRAY Emergency System"
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=_POOL_MAXSIZE,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# NWS alert fields: (our key, NWS property, default)
+_ALERT_FIELDS = (
+    ("event", "event", "Unknown"),
+    ("headline", "headline", ""),
+    ("severity", "severity", "Unknown"),
+    ("urgency", "urgency", "Unknown"),
+    ("areas", "areaDesc", ""),
+    ("expires", "expires", ""),
+)
+
+# NWS alerts shown per poll
+_MAX_ALERTS = 5
+
+# Read size for discarding the unparsed rest of a streamed response
+_DRAIN_CHUNK = 64 * 1024
+
+# NWS severity -> CITYARRAY alert tier
+_SEVERITY_TIER = {
+    "Extreme": "emergency",
+    "Severe": "emergency",
+    "Moderate": "warning",
+    "Minor": "advisory",
+    "Unknown": "informational"
+}
+
+
+@dataclass
+class CacheEntry:
+    """Cached fetch result with freshness deadlines (monotonic seconds)."""
+    value: Any
+    fresh_until: float
+    stale_until: float
+
 
 class CityData:
-    def __init__(self, city="Los Angeles", state="CA", lat=34.05, lon=-118.24):
+    def __init__(self, city="Los Angeles", state="CA", lat=34.05, lon=-118.24, session=None):
         self.city = city
         self.state = state
         self.lat = lat
         self.lon = lon
+        self._session = session or _SESSION
+        self._cache: dict[str, CacheEntry] = {}
+        # Last 200 response per URL: (ETag, Last-Modified, parsed body)
+        self._validated: dict[str, tuple] = {}
+        self._refreshing: set[str] = set()
+        self._cache_lock = threading.Lock()
+    
+    def _cached(self, key, ttl, swr, fetch_fn):
+        """
+        Stale-while-revalidate lookup.
+        
+        Fresh (< ttl): return cached value.
+        Stale (< ttl + swr): return cached value, refresh in background.
+        Rotten/missing: fetch synchronously.
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        
+        if entry is not None and now < entry.fresh_until:
+            return entry.value
+        
+        if entry is not None and now < entry.stale_until:
+            with self._cache_lock:
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(
+                        target=self._refresh, args=(key, fetch_fn, ttl, swr), daemon=True
+                    ).start()
+            return entry.value
+        
+        return self._store(key, fetch_fn(), ttl, swr)
+    
+    def _refresh(self, key, fetch_fn, ttl, swr):
+        """Background refresh for a stale cache entry."""
+        try:
+            self._store(key, fetch_fn(), ttl, swr)
+        finally:
+            with self._cache_lock:
+                self._refreshing.discard(key)
+    
+    def _store(self, key, value, ttl, swr):
+        """Cache a fetch result unless it is an error."""
+        failed = (
+            (isinstance(value, dict) and "error" in value)
+            or (isinstance(value, list) and value and "error" in value[0])
+        )
+        if not failed:
+            now = time.monotonic()
+            self._cache[key] = CacheEntry(value, now + ttl, now + ttl + swr)
+        return value
+    
+    def _get_json(self, url, parse=None):
+        """
+        GET a JSON endpoint, revalidating the last response.
+        
+        Sends If-None-Match / If-Modified-Since from the previous 200; on
+        304 the previous result is returned without a download or parse.
+        
+        Args:
+            url: Endpoint URL
+            parse: Turns the (streamed) response into the result
+                   (default: parse the whole body)
+        """
+        previous = self._validated.get(url)
+        headers = {}
+        if previous is not None:
+            etag, last_modified, _ = previous
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        with self._session.get(url, headers=headers, timeout=10, stream=True) as resp:
+            if resp.status_code == 304 and previous is not None:
+                return previous[2]
+            data = parse(resp) if parse else _json.loads(resp.content)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if resp.status_code == 200 and (etag or last_modified):
+                self._validated[url] = (etag, last_modified, data)
+        return data
     
     def get_weather(self):
+        """Get current weather (cached 10 min)."""
+        return self._cached("weather", 600, 1800, self._fetch_weather)
+    
+    def get_air_quality(self):
+        """Get AQI (cached 10 min)."""
+        return self._cached("air_quality", 600, 1800, self._fetch_air_quality)
+    
+    def get_nws_alerts(self):
+        """Get NWS alerts (cached 1 min)."""
+        return self._cached("nws_alerts", 60, 300, self._fetch_nws_alerts)
+    
+    def _fetch_weather(self):
         """Get current weather."""
         try:
-            url = f"http://api.openweathermap.org/data/2.5/weather?q={self.city}&appid={fd9375b142b3e1233b7b2aa0160762b5}&units=imperial"
-            data = requests.get(url, timeout=10).json()
+            url = f"http://api.openweathermap.org/data/2.5/weather?q={self.city}&appid={OPENWEATHER_KEY}&units=imperial"
+            data = self._get_json(url)
             
             return {
                 "temp_f": round(data["main"]["temp"]),
@@ -35,11 +196,11 @@ class CityData:
         except Exception as e:
             return {"error": str(e)}
     
-    def get_air_quality(self):
+    def _fetch_air_quality(self):
         """Get AQI from OpenWeather."""
         try:
-            url = f"http://api.openweathermap.org/data/2.5/air_pollution?lat={self.lat}&lon={self.lon}&appid={fd9375b142b3e1233b7b2aa0160762b5}"
-            data = requests.get(url, timeout=10).json()
+            url = f"http://api.openweathermap.org/data/2.5/air_pollution?lat={self.lat}&lon={self.lon}&appid={OPENWEATHER_KEY}"
+            data = self._get_json(url)
             
             aqi = data["list"][0]["main"]["aqi"]
             # 1=Good, 2=Fair, 3=Moderate, 4=Poor, 5=Very Poor
@@ -53,59 +214,96 @@ class CityData:
         except Exception as e:
             return {"error": str(e)}
     
-    def get_nws_alerts(self):
+    def _fetch_nws_alerts(self):
         """Get real NWS alerts for state."""
         try:
             url = f"https://api.weather.gov/alerts/active?area={self.state}"
-            headers = {"User-Agent": "CITYARRAY Emergency System"}
-            data = requests.get(url, headers=headers, timeout=10).json()
-            
-            alerts = []
-            for feature in data.get("features", [])[:5]:  # Top 5
-                props = feature["properties"]
-                alerts.append({
-                    "event": props.get("event", "Unknown"),
-                    "headline": props.get("headline", ""),
-                    "severity": props.get("severity", "Unknown"),
-                    "urgency": props.get("urgency", "Unknown"),
-                    "areas": props.get("areaDesc", ""),
-                    "expires": props.get("expires", "")
-                })
-            return alerts
+            return self._get_json(url, _parse_nws_alerts)
         except Exception as e:
             return [{"error": str(e)}]
     
-    def get_alert_tier(self, severity):
+    @staticmethod
+    def get_alert_tier(severity):
         """Map NWS severity to our tier."""
-        mapping = {
-            "Extreme": "emergency",
-            "Severe": "emergency",
-            "Moderate": "warning",
-            "Minor": "advisory",
-            "Unknown": "informational"
-        }
-        return mapping.get(severity, "informational")
+        return _SEVERITY_TIER.get(severity, "informational")
+    
+    def get_all(self):
+        """Fetch weather, AQI and NWS alerts in parallel.
+        
+        Returns: (weather, air_quality, alerts)
+        """
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            weather = pool.submit(self.get_weather)
+            aqi = pool.submit(self.get_air_quality)
+            alerts = pool.submit(self.get_nws_alerts)
+            return weather.result(), aqi.result(), alerts.result()
+
+
+def _parse_nws_alerts(resp):
+    """
+    First _MAX_ALERTS alerts from an NWS response.
+    
+    With ijson, features are parsed off the socket as they arrive and
+    parsing stops after the last one needed. The rest of the body is then
+    read and discarded, so the pooled connection can be reused.
+    """
+    if IJSON_AVAILABLE:
+        resp.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+        features = islice(ijson.items(resp.raw, "features.item"), _MAX_ALERTS)
+    else:
+        features = islice(_json.loads(resp.content).get("features") or (), _MAX_ALERTS)
+    
+    alerts = []
+    for feature in features:
+        props = feature["properties"]
+        alerts.append({key: props.get(prop, default) for key, prop, default in _ALERT_FIELDS})
+    
+    if IJSON_AVAILABLE:
+        while resp.raw.read(_DRAIN_CHUNK):
+            pass
+    return alerts
+
+
+def get_all_cities(cities):
+    """
+    Refresh several cities at once over the shared connection pool.
+    
+    Every city/endpoint request runs on one pool sized to the session's
+    per-host connection limit, so N cities reuse a handful of warm
+    sockets instead of opening N x 3 connections.
+    
+    Returns: list of (weather, air_quality, alerts), one per city
+    """
+    with ThreadPoolExecutor(max_workers=_POOL_MAXSIZE) as pool:
+        futures = [
+            (pool.submit(c.get_weather), pool.submit(c.get_air_quality), pool.submit(c.get_nws_alerts))
+            for c in cities
+        ]
+        return [tuple(f.result() for f in city_futures) for city_futures in futures]
+
+
+def close_pool():
+    """Close the shared session's pooled connections (call on shutdown)."""
+    _SESSION.close()
 
 
 if __name__ == "__main__":
     city = CityData()
+    weather, aqi, alerts = city.get_all()
     
     print("=== Weather ===")
-    weather = city.get_weather()
     if "error" not in weather:
         print(f"{weather['temp_f']}°F, {weather['conditions']}")
     else:
         print(f"Error: {weather['error']}")
     
     print("\n=== Air Quality ===")
-    aqi = city.get_air_quality()
     if "error" not in aqi:
         print(f"AQI Level: {aqi['level']} (PM2.5: {aqi['pm25']})")
     else:
         print(f"Error: {aqi['error']}")
     
     print("\n=== NWS Alerts ===")
-    alerts = city.get_nws_alerts()
     if alerts and "error" not in alerts[0]:
         for a in alerts:
             print(f"[{a['severity']}] {a['event']}: {a['headline'][:80]}...")
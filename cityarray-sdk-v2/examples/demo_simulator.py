@@ -125,14 +125,12 @@ class SecureSimulatorDemo:
         self.display_message("CITYARRAY READY", "informational")
         
         while running:
-            # Process pygame events
-            if not self.backend.process_events():
-                running = False
-                continue
-            
-            # Check for key presses
+            # Single event drain per frame: window close, ESC and hotkeys
             for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
+                if event.type == pygame.QUIT:
+                    running = False
+                
+                elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_1:
                         self.display_message("CROWD: 1250", "informational")
                     
@@ -163,7 +161,7 @@ class SecureSimulatorDemo:
                     elif event.key == pygame.K_ESCAPE:
                         running = False
             
-            # Render and tick
+            # Render (no-op unless the pixel buffer changed) and tick
             self.backend.simulator.render()
             self.backend.tick(30)
         
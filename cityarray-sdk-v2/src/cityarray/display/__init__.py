@@ -9,6 +9,7 @@ from .secure_engine import (
     SecureDisplayBackend,
     ConsoleDisplayBackend,
     DisplayResult,
+    RejectCode,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "SecureDisplayBackend", 
     "ConsoleDisplayBackend",
     "DisplayResult",
+    "RejectCode",
 ]
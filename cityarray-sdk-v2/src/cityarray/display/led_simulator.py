@@ -5,12 +5,24 @@ A pygame-based LED matrix simulator for testing without hardware.
 Simulates a 64x32 pixel LED display matching the P3 panel spec.
 """
 
-import pygame
 import numpy as np
 from typing import Tuple, Optional, Dict, Any
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 
+# pygame is imported on first use so that headless consumers of this
+# module (configs, colors, fonts) don't pay for loading SDL
+pygame = None
+
+
+def _ensure_pygame() -> None:
+    """Import pygame into the module namespace if not already loaded."""
+    global pygame
+    if pygame is None:
+        import pygame as _pygame
+        pygame = _pygame
+
 
 class LEDColor(Enum):
     """Standard LED colors for emergency signage."""
@@ -80,6 +92,42 @@ FONT_5X7 = {
     '?': [0x02, 0x01, 0x51, 0x09, 0x06],
 }
 
+# Glyph masks indexed by ASCII code: FONT_LUT[code] is a (7 rows, 5 cols)
+# boolean mask (bit N of each column byte is row N). Lowercase codes map to
+# the uppercase glyphs and every code without a glyph renders as '?'.
+FONT_LUT = np.zeros((128, 7, 5), dtype=bool)
+_UNKNOWN_CODE = ord('?')
+
+
+def _build_font_lut() -> None:
+    for ch, bits in FONT_5X7.items():
+        FONT_LUT[ord(ch)] = np.array(
+            [[(b >> r) & 1 for r in range(7)] for b in bits], dtype=bool
+        ).T
+    for code in range(128):
+        ch = chr(code)
+        if ch not in FONT_5X7:
+            upper = ch.upper()
+            FONT_LUT[code] = FONT_LUT[ord(upper) if upper in FONT_5X7 else _UNKNOWN_CODE]
+
+
+_build_font_lut()
+
+# FONT_LUT with the 1-pixel spacing column appended: a run of glyphs laid
+# side by side is a (7, 6 * n) mask, so a whole line is one masked copy
+_FONT_LUT_SPACED = np.zeros((128, 7, 6), dtype=bool)
+_FONT_LUT_SPACED[:, :, :5] = FONT_LUT
+
+
+def _glyph_code(char: str) -> int:
+    """FONT_LUT index for a character (see LEDSimulator.draw_char)."""
+    code = ord(char)
+    if code >= 128:
+        # A few non-ASCII letters uppercase to ASCII (e.g. dotless i)
+        upper = char.upper()
+        code = ord(upper) if len(upper) == 1 and ord(upper) < 128 else _UNKNOWN_CODE
+    return code
+
 
 class LEDSimulator:
     """
@@ -89,6 +137,12 @@ class LEDSimulator:
     Integrates with the CITYARRAY SDK display backend.
     """
     
+    # Margin around the render frame so edge glow discs stay in bounds
+    _FRAME_PAD = 2
+    
+    # Max cached (char code, color) glyph stamps
+    _STAMP_CACHE_SIZE = 512
+    
     def __init__(self, config: Optional[SimulatorConfig] = None):
         """Initialize the LED simulator."""
         self.config = config or SimulatorConfig()
@@ -103,26 +157,95 @@ class LEDSimulator:
             + self.config.pixel_gap
         )
         
-        # Pixel buffer - stores RGB color for each LED
-        self.pixels = np.zeros((self.config.height, self.config.width, 3), dtype=np.uint8)
+        # Pixel buffer - stores RGB color for each LED.
+        # It is an RGB view into an RGBX buffer, so render() reads every
+        # LED as one packed uint32 without copying.
+        self._led_rgbx = np.zeros((self.config.height, self.config.width, 4), dtype=np.uint8)
+        self._led_packed = self._led_rgbx.view(np.uint32)[..., 0]
+        self.pixels = self._led_rgbx[..., :3]
+        
+        # Last rendered frame: render() only redraws the rows that differ
+        # from it, whether changed by the drawing methods or written directly
+        self._prev_pixels: Optional[np.ndarray] = None
+        
+        # (char code, color) -> (7, 5, 3) colored glyph, LRU-evicted
+        self._stamp_cache: OrderedDict = OrderedDict()
         
         # Pygame initialization
         self._initialized = False
         self.screen = None
         self.clock = None
+        
+        # Precomputed geometry and buffers for vectorized rendering (built in init)
+        self._background_frame = None
+        self._frame = self._frame32 = self._frame_surface = None
+        self._disc_index = None
+        self._glow_index = None
     
     def init(self) -> bool:
         """Initialize pygame. Call before using the simulator."""
         if self._initialized:
             return True
         
+        _ensure_pygame()
         pygame.init()
         self.screen = pygame.display.set_mode((self.window_width, self.window_height))
         pygame.display.set_caption(self.config.title)
         self.clock = pygame.time.Clock()
+        self._build_render_maps()
+        self._prev_pixels = None  # New window: next render is a full redraw
         self._initialized = True
         return True
     
+    @staticmethod
+    def _ellipse_mask(size: int) -> np.ndarray:
+        """Boolean (row, col) mask of a filled ellipse as pygame rasterizes it."""
+        scratch = pygame.Surface((size, size))
+        scratch.fill((0, 0, 0))
+        pygame.draw.ellipse(scratch, (255, 255, 255), scratch.get_rect())
+        # surfarray is (x, y); transpose to (row, col)
+        return pygame.surfarray.array_red(scratch).T > 0
+    
+    def _build_render_maps(self) -> None:
+        """
+        Precompute frame geometry for vectorized rendering.
+        
+        The frame is an RGBX buffer viewed as one uint32 per window pixel.
+        Each LED's disc and glow disc are stored as flat frame indices so a
+        frame can be painted with one scatter per layer.
+        """
+        cfg = self.config
+        pad = self._FRAME_PAD
+        pitch = cfg.pixel_size + cfg.pixel_gap
+        frame_w = self.window_width + 2 * pad
+        frame_h = self.window_height + 2 * pad
+        
+        self._background_frame = np.empty((frame_h, frame_w, 4), dtype=np.uint8)
+        self._background_frame[:] = (*cfg.background, 0)
+        background32 = self._background_frame.view(np.uint32)[..., 0]
+        
+        # Persistent frame, wrapped (zero-copy) by a pygame surface
+        self._frame = np.empty_like(self._background_frame)
+        self._frame32 = self._frame.view(np.uint32)[..., 0]
+        self._frame_surface = pygame.image.frombuffer(self._frame, (frame_w, frame_h), "RGBX")
+        
+        origin_y = np.arange(cfg.height) * pitch + cfg.pixel_gap + pad
+        origin_x = np.arange(cfg.width) * pitch + cfg.pixel_gap + pad
+        
+        # Flat frame indices of every LED disc; off LEDs are black discs,
+        # so bake them into the background and only draw lit LEDs per frame
+        dy, dx = np.nonzero(self._ellipse_mask(cfg.pixel_size))
+        self._disc_index = (
+            (origin_y[:, None, None] + dy) * frame_w + origin_x[None, :, None] + dx
+        )
+        background32.reshape(-1)[self._disc_index.reshape(-1)] = 0
+        
+        # Glow disc is 4px larger, offset by -2px
+        gy, gx = np.nonzero(self._ellipse_mask(cfg.pixel_size + 4))
+        self._glow_index = (
+            (origin_y[:, None, None] - 2 + gy) * frame_w + origin_x[None, :, None] - 2 + gx
+        )
+    
     def quit(self) -> None:
         """Clean up pygame resources."""
         if self._initialized:
@@ -131,7 +254,7 @@ class LEDSimulator:
     
     def clear(self, color: Tuple[int, int, int] = (0, 0, 0)) -> None:
         """Clear all pixels to specified color (default: off/black)."""
-        self.pixels[:, :] = color
+        self.pixels[...] = color
     
     def set_pixel(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
         """Set a single pixel to specified RGB color."""
@@ -156,19 +279,35 @@ class LEDSimulator:
         
         Returns: width of character drawn (for positioning next char)
         """
-        char = char.upper()
-        if char not in FONT_5X7:
-            char = '?'
-        
-        bitmap = FONT_5X7[char]
+        code = _glyph_code(char)
+        mask = FONT_LUT[code]
+        stamp = self._get_stamp(code, color)
         
-        for col, byte in enumerate(bitmap):
-            for row in range(7):
-                if byte & (1 << row):
-                    self.set_pixel(x + col, y + row, color)
+        # Clip glyph to the display
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + mask.shape[1], self.config.width)
+        y1 = min(y + mask.shape[0], self.config.height)
+        if x0 < x1 and y0 < y1:
+            src = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+            np.copyto(self.pixels[y0:y1, x0:x1], stamp[src], where=mask[src][..., None])
         
         return 6  # Character width + 1 pixel spacing
     
+    def _get_stamp(self, code: int, color: Tuple[int, int, int]) -> np.ndarray:
+        """Get the colored (7, 5, 3) stamp for a glyph, building it on first use."""
+        key = (code, tuple(color))
+        stamp = self._stamp_cache.get(key)
+        if stamp is not None:
+            self._stamp_cache.move_to_end(key)
+            return stamp
+        
+        stamp = np.zeros(FONT_LUT[code].shape + (3,), dtype=np.uint8)
+        stamp[FONT_LUT[code]] = color
+        self._stamp_cache[key] = stamp
+        if len(self._stamp_cache) > self._STAMP_CACHE_SIZE:
+            self._stamp_cache.popitem(last=False)
+        return stamp
+    
     def draw_text(
         self,
         text: str,
@@ -191,9 +330,26 @@ class LEDSimulator:
             text_width = len(text) * 6 - 1
             x = x - text_width // 2
         
-        cursor_x = x
-        for char in text:
-            cursor_x += self.draw_char(char, cursor_x, y, color)
+        if not text:
+            return
+        
+        # Same pixels as draw_char per character, as a single masked copy
+        if text.isascii():
+            codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        else:
+            codes = np.fromiter(map(_glyph_code, text), dtype=np.uint8, count=len(text))
+        glyphs = _FONT_LUT_SPACED[codes]                    # (n, 7, 6)
+        mask = glyphs.transpose(1, 0, 2).reshape(7, -1)     # (7, 6n)
+        
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + mask.shape[1], self.config.width)
+        y1 = min(y + 7, self.config.height)
+        if x0 < x1 and y0 < y1:
+            np.copyto(
+                self.pixels[y0:y1, x0:x1],
+                np.asarray(color, dtype=np.uint8),
+                where=mask[y0 - y:y1 - y, x0 - x:x1 - x, None],
+            )
     
     def draw_text_centered(
         self,
@@ -215,50 +371,120 @@ class LEDSimulator:
         color: Tuple[int, int, int]
     ) -> None:
         """Fill a rectangular area with color."""
-        for py in range(y, min(y + height, self.config.height)):
-            for px in range(x, min(x + width, self.config.width)):
-                self.set_pixel(px, py, color)
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + width, self.config.width)
+        y1 = min(y + height, self.config.height)
+        if x0 < x1 and y0 < y1:
+            self.pixels[y0:y1, x0:x1] = color
     
     def render(self) -> None:
-        """Render the pixel buffer to the pygame window."""
+        """
+        Render the pixel buffer to the pygame window.
+        
+        Only the band of rows that changed since the last render (through
+        the drawing methods or direct writes to pixels) is redrawn. Glow
+        discs reach 2px past each LED, so with glow on and pixel_gap below 2
+        (the default is 2) every render is instead a full, per-LED redraw.
+        """
         if not self._initialized:
             self.init()
         
-        # Fill background
-        self.screen.fill(self.config.background)
-        
-        # Draw each LED pixel
-        for y in range(self.config.height):
-            for x in range(self.config.width):
-                color = tuple(self.pixels[y, x])
-                
-                # Calculate screen position
-                screen_x = x * (self.config.pixel_size + self.config.pixel_gap) + self.config.pixel_gap
-                screen_y = y * (self.config.pixel_size + self.config.pixel_gap) + self.config.pixel_gap
-                
-                # Draw glow effect (larger, dimmer circle behind)
-                if self.config.glow and color != (0, 0, 0):
-                    glow_color = tuple(c // 4 for c in color)
-                    glow_size = self.config.pixel_size + 4
-                    glow_rect = pygame.Rect(
-                        screen_x - 2,
-                        screen_y - 2,
-                        glow_size,
-                        glow_size
+        if self._prev_pixels is None:
+            self._prev_pixels = self.pixels.copy()
+        else:
+            changed = np.flatnonzero(np.any(self.pixels != self._prev_pixels, axis=(1, 2)))
+            if changed.size == 0:
+                return
+            np.copyto(self._prev_pixels, self.pixels)
+            if not (self.config.glow and self.config.pixel_gap < 2):
+                self._render_rows(int(changed[0]), int(changed[-1]) + 1)
+                return
+        
+        if self.config.glow and self.config.pixel_gap < 2:
+            self._render_overlapping()
+        else:
+            self._render_rows(0, self.config.height)
+    
+    def _render_overlapping(self) -> None:
+        """
+        Redraw the whole window LED by LED, in row order.
+        
+        With pixel_gap below 2, glow discs overlap neighbouring LEDs, and
+        what ends up on screen depends on drawing order (each LED's glow,
+        then its disc, over everything drawn before). The layered scatter
+        in _render_rows cannot reproduce that, so this path keeps the
+        per-LED drawing.
+        """
+        cfg = self.config
+        pitch = cfg.pixel_size + cfg.pixel_gap
+        glow_size = cfg.pixel_size + 4
+        self.screen.fill(cfg.background)
+        for y, row in enumerate(self.pixels.tolist()):
+            screen_y = y * pitch + cfg.pixel_gap
+            for x, color in enumerate(row):
+                screen_x = x * pitch + cfg.pixel_gap
+                if color != [0, 0, 0]:
+                    pygame.draw.ellipse(
+                        self.screen, [c // 4 for c in color],
+                        (screen_x - 2, screen_y - 2, glow_size, glow_size)
                     )
-                    pygame.draw.ellipse(self.screen, glow_color, glow_rect)
-                
-                # Draw the LED pixel
-                pixel_rect = pygame.Rect(
-                    screen_x,
-                    screen_y,
-                    self.config.pixel_size,
-                    self.config.pixel_size
+                pygame.draw.ellipse(
+                    self.screen, color, (screen_x, screen_y, cfg.pixel_size, cfg.pixel_size)
                 )
-                pygame.draw.ellipse(self.screen, color, pixel_rect)
+        pygame.display.flip()
+    
+    def _render_rows(self, row_start: int, row_end: int) -> None:
+        """Redraw the window band covering LED rows [row_start, row_end)."""
+        cfg = self.config
+        pad = self._FRAME_PAD
+        pitch = cfg.pixel_size + cfg.pixel_gap
+        frame32 = self._frame32
+        packed = self._led_packed
+        
+        # Band spans the cells of the rows plus the gap below the last one
+        band_top = pad + row_start * pitch
+        band_bottom = pad + row_end * pitch + cfg.pixel_gap
+        np.copyto(self._frame[band_top:band_bottom], self._background_frame[band_top:band_bottom])
+        
+        # Only lit LEDs are drawn; rows adjacent to the band are included
+        # because their glow discs can reach into it
+        glow_start = max(row_start - 1, 0) if cfg.glow else row_start
+        glow_end = min(row_end + 1, cfg.height) if cfg.glow else row_end
+        rows = packed[glow_start:glow_end]
+        lit = np.argwhere(rows)
+        if lit.size:
+            ly, lx = lit[:, 0], lit[:, 1]
+            colors = rows[ly, lx]
+            # Single-color frames (the common text case) scatter one scalar
+            # instead of materializing a color per disc pixel
+            mono = bool((colors == colors[0]).all())
+            frame_flat = frame32.reshape(-1)
+            band_lo = band_top * frame32.shape[1]
+            band_hi = band_bottom * frame32.shape[1]
+            
+            # Glow effect (larger, dimmer disc behind each lit LED)
+            if cfg.glow:
+                # Per-channel c // 4 on packed words: shift, then drop bits
+                # that crossed into the neighbouring byte
+                glow = (colors >> 2) & np.uint32(0x3F3F3F3F)
+                index = self._glow_index[ly + glow_start, lx]
+                inside = (index >= band_lo) & (index < band_hi)
+                if mono:
+                    frame_flat[index[inside]] = glow[0]
+                else:
+                    frame_flat[index[inside]] = np.broadcast_to(glow[:, None], index.shape)[inside]
+            
+            # LED discs
+            in_band = (ly + glow_start >= row_start) & (ly + glow_start < row_end)
+            index = self._disc_index[ly[in_band] + glow_start, lx[in_band]]
+            frame_flat[index] = colors[0] if mono else colors[in_band][:, None]
+        
+        # Frame coordinates are offset by pad from window coordinates
+        band = pygame.Rect(0, band_top - pad, self.window_width, band_bottom - band_top)
+        self.screen.blit(self._frame_surface, band.topleft, band.move(pad, pad))
         
         # Update display
-        pygame.display.flip()
+        pygame.display.update(band)
     
     def process_events(self) -> bool:
         """
@@ -266,6 +492,7 @@ class LEDSimulator:
         
         Returns: False if window should close, True otherwise
         """
+        _ensure_pygame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -8,11 +8,14 @@ Display engine with integrated security:
 - Enforces tier-based authorization requirements
 """
 
+import sys
+import time
 import logging
 import hashlib
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
 from dataclasses import dataclass
+from enum import IntEnum
 from datetime import datetime, timezone
 
 from ..security.signing import (
@@ -24,14 +27,78 @@ from ..security.tiers import AlertTier, TierValidator, is_template_autonomous
 
 logger = logging.getLogger(__name__)
 
+# Tier lookup by wire value; avoids the enum constructor (and its
+# exception path) on every display
+_TIER_FROM_STR: Dict[str, AlertTier] = {t.value: t for t in AlertTier}
 
-@dataclass
+
+def wrap_text(text: str, width: int, max_lines: Optional[int] = None) -> List[str]:
+    """
+    Greedy word wrap shared by the display backends.
+    
+    Each line starts with a word (an over-long word gets a line of its own)
+    and takes further words while it stays within width. Only line lengths
+    are tracked; each line is joined once, and wrapping stops as soon as
+    max_lines lines have been produced.
+    
+    Args:
+        text: Text to wrap (split on whitespace)
+        width: Maximum characters per line
+        max_lines: Stop after this many lines (None for no limit)
+        
+    Returns:
+        List of wrapped lines
+    """
+    words = text.split()
+    if not words:
+        return []
+    
+    lines: List[str] = []
+    start = 0
+    line_len = len(words[0])
+    # Word lengths come from map(len) in C; "fits" is line_len + 1 + n <= width
+    for i, word_len in enumerate(map(len, words[1:]), 1):
+        if line_len + word_len < width:
+            line_len += word_len + 1
+            continue
+        if max_lines is not None and len(lines) >= max_lines:
+            return lines
+        lines.append(" ".join(words[start:i]))
+        start = i
+        line_len = word_len
+    
+    if max_lines is None or len(lines) < max_lines:
+        lines.append(" ".join(words[start:]))
+    return lines
+
+
+def _iso_from_ns(ns: int) -> str:
+    """UTC ISO-8601 timestamp for a time.time_ns() value (microsecond precision)."""
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+        microsecond=remainder // 1000
+    ).isoformat()
+
+
+class RejectCode(IntEnum):
+    """Machine-readable reason a message was not displayed."""
+    SIGNATURE_INVALID = 1
+    EXPIRED = 2
+    REPLAY = 3
+    INVALID_MESSAGE = 4
+    UNKNOWN_TIER = 5
+    TIER_VALIDATION = 6
+    RENDER_FAILED = 7
+
+
+@dataclass(slots=True)
 class DisplayResult:
     """Result of a display operation."""
     success: bool
     message_id: Optional[str]
     error: Optional[str] = None
     displayed_at: Optional[str] = None
+    code: Optional[RejectCode] = None  # Set on failure; cheaper to branch on than error
 
 
 class SecureDisplayBackend(ABC):
@@ -128,59 +195,106 @@ class SecureDisplayEngine:
         Returns:
             DisplayResult indicating success or failure
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now_ns = time.time_ns()
         
         # Step 1: Verify signature
         try:
-            self.verifier.verify(message)
-        except SignatureError as e:
-            error = f"Signature verification failed: {e}"
-            logger.error(f"SECURITY: {error}")
-            self.audit.log_signature_invalid(message.message_id, str(e))
-            self._reject(message, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
-        except MessageExpiredError as e:
-            error = f"Message expired: {e}"
+            self.verifier.verify(message, now_ns=now_ns)
+        except (SignatureError, MessageExpiredError, ReplayDetectedError, ValueError) as e:
+            return self._reject_unverified(message, e)
+        
+        return self._display_verified(message, now_ns)
+    
+    def display_batch(
+        self,
+        messages: List[SignedMessage],
+        max_workers: Optional[int] = None
+    ) -> List[DisplayResult]:
+        """
+        Display a batch of signed messages in order.
+        
+        Verification for the whole batch is done up front via
+        MessageVerifier.verify_batch; each message then goes through the
+        same tier validation, render and audit steps as display().
+        
+        Args:
+            messages: Signed messages to display
+            max_workers: Threads for signature checks (None = check inline)
+            
+        Returns:
+            One DisplayResult per message, in the same order
+        """
+        now_ns = time.time_ns()
+        verify_errors = self.verifier.verify_batch(
+            messages, now_ns=now_ns, max_workers=max_workers
+        )
+        
+        results = []
+        for message, verify_error in zip(messages, verify_errors):
+            if verify_error is not None:
+                results.append(self._reject_unverified(message, verify_error))
+            else:
+                results.append(self._display_verified(message, now_ns))
+        return results
+    
+    def _reject_unverified(self, message: SignedMessage, exc: Exception) -> DisplayResult:
+        """Audit and reject a message that failed verification."""
+        if isinstance(exc, SignatureError):
+            error = f"Signature verification failed: {exc}"
+            logger.error("SECURITY: %s", error)
+            self.audit.log_signature_invalid(message.message_id, str(exc))
+            code = RejectCode.SIGNATURE_INVALID
+        elif isinstance(exc, MessageExpiredError):
+            error = f"Message expired: {exc}"
             logger.warning(error)
             self.audit.log_message_rejected(message.message_id, "expired")
-            self._reject(message, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
-        except ReplayDetectedError as e:
-            error = f"Replay attack detected: {e}"
-            logger.error(f"SECURITY: {error}")
+            code = RejectCode.EXPIRED
+        elif isinstance(exc, ReplayDetectedError):
+            error = f"Replay attack detected: {exc}"
+            logger.error("SECURITY: %s", error)
             self.audit.log(AuditEventType.REPLAY_DETECTED, {
                 "message_id": message.message_id,
                 "nonce": message.nonce
             })
-            self._reject(message, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
-        except ValueError as e:
-            error = f"Invalid message: {e}"
+            code = RejectCode.REPLAY
+        else:
+            error = f"Invalid message: {exc}"
             logger.error(error)
-            self.audit.log_message_rejected(message.message_id, str(e))
-            self._reject(message, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
+            self.audit.log_message_rejected(message.message_id, str(exc))
+            code = RejectCode.INVALID_MESSAGE
         
+        self._reject(message, error)
+        return DisplayResult(
+            success=False, message_id=message.message_id, error=error, code=code
+        )
+    
+    def _display_verified(self, message: SignedMessage, now_ns: int) -> DisplayResult:
+        """Validate tier, render and audit a message whose signature checked out."""
         # Step 2: Validate tier authorization
-        try:
-            tier = AlertTier(message.tier)
-        except ValueError:
+        tier = _TIER_FROM_STR.get(message.tier)
+        if tier is None:
             error = f"Unknown tier: {message.tier}"
             logger.error(error)
             self.audit.log_message_rejected(message.message_id, error)
             self._reject(message, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
+            return DisplayResult(
+                success=False, message_id=message.message_id, error=error,
+                code=RejectCode.UNKNOWN_TIER
+            )
         
         template_id = message.content.get("template_id", "unknown")
-        authorizations = [a.to_dict() for a in message.authorizations]
-        
-        is_valid, tier_error = self.tier_validator.validate(tier, template_id, authorizations)
+        is_valid, tier_error = self.tier_validator.validate(
+            tier, template_id, message.authorizations
+        )
         if not is_valid:
             error = f"Tier validation failed: {tier_error}"
-            logger.error(f"SECURITY: {error}")
+            logger.error("SECURITY: %s", error)
             self.audit.log_message_rejected(message.message_id, tier_error)
             self._reject(message, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
+            return DisplayResult(
+                success=False, message_id=message.message_id, error=error,
+                code=RejectCode.TIER_VALIDATION
+            )
         
         # Step 3: Render to display
         try:
@@ -189,17 +303,24 @@ class SecureDisplayEngine:
             error = f"Render failed: {e}"
             logger.error(error)
             self.audit.log_message_rejected(message.message_id, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
+            return DisplayResult(
+                success=False, message_id=message.message_id, error=error,
+                code=RejectCode.RENDER_FAILED
+            )
         
         if not success:
             error = "Backend render returned false"
             self.audit.log_message_rejected(message.message_id, error)
-            return DisplayResult(success=False, message_id=message.message_id, error=error)
+            return DisplayResult(
+                success=False, message_id=message.message_id, error=error,
+                code=RejectCode.RENDER_FAILED
+            )
         
         # Step 4: Log success and update state
-        content_hash = hashlib.sha256(
-            str(message.content).encode()
-        ).hexdigest()[:16]
+        # Canonical content bytes, as checked by the verifier above
+        content_hash = hashlib.blake2b(
+            message.canonical_content, digest_size=8
+        ).hexdigest()
         
         self.audit.log_message_displayed(
             message_id=message.message_id,
@@ -213,14 +334,15 @@ class SecureDisplayEngine:
             try:
                 self._on_display_callback(message)
             except Exception as e:
-                logger.error(f"Display callback error: {e}")
+                logger.error("Display callback error: %s", e)
         
-        logger.info(f"Displayed message {message.message_id} (tier: {message.tier})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Displayed message %s (tier: %s)", message.message_id, message.tier)
         
         return DisplayResult(
             success=True,
             message_id=message.message_id,
-            displayed_at=now
+            displayed_at=_iso_from_ns(now_ns)
         )
     
     def _reject(self, message: SignedMessage, reason: str) -> None:
@@ -229,7 +351,7 @@ class SecureDisplayEngine:
             try:
                 self._on_reject_callback(message, reason)
             except Exception as e:
-                logger.error(f"Reject callback error: {e}")
+                logger.error("Reject callback error: %s", e)
     
     def clear(self) -> bool:
         """
@@ -260,6 +382,8 @@ class ConsoleDisplayBackend(SecureDisplayBackend):
     def __init__(self, width: int = 64, height: int = 16):
         self.width = width
         self.height = height
+        self._border = "+" + "-" * (width + 2) + "+\n"
+        self._blank = "|" + " " * (width + 2) + "|\n"
     
     def render(self, content: Dict[str, Any]) -> bool:
         """Render to console."""
@@ -275,40 +399,27 @@ class ConsoleDisplayBackend(SecureDisplayBackend):
         else:
             display_text = f"[{template_id}]"
         
-        # Print bordered display
-        border = "+" + "-" * (self.width + 2) + "+"
-        print("\n" + border)
-        
-        # Word wrap and center
-        words = display_text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            if len(current_line) + len(word) + 1 <= self.width:
-                current_line += (" " if current_line else "") + word
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-        
-        for line in lines[:self.height]:
-            padded = line.center(self.width)
-            print(f"| {padded} |")
-        
-        print(border + "\n")
+        # Bordered display, word wrapped and centered, written in one go
+        parts = ["\n", self._border]
+        parts.extend(
+            f"| {line.center(self.width)} |\n"
+            for line in wrap_text(display_text, self.width, max_lines=self.height)
+        )
+        parts.append(self._border)
+        parts.append("\n")
+        self._write("".join(parts))
         return True
     
     def clear(self) -> bool:
         """Clear console display."""
-        border = "+" + "-" * (self.width + 2) + "+"
-        print("\n" + border)
-        for _ in range(3):
-            print(f"|{' ' * (self.width + 2)}|")
-        print(border + "\n")
+        self._write("\n" + self._border + self._blank * 3 + self._border + "\n")
         return True
     
+    @staticmethod
+    def _write(frame: str) -> None:
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+    
     def get_capabilities(self) -> Dict[str, Any]:
         return {
             "width": self.width,
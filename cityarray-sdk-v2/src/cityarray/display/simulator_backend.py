@@ -5,19 +5,53 @@ Connects the LED simulator to the SDK security layer.
 Only cryptographically signed messages can be displayed.
 """
 
-from typing import Dict, Any, Optional
-from .led_simulator import LEDSimulator, LEDColor, SimulatorConfig
-from .secure_engine import SecureDisplayBackend
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from .secure_engine import SecureDisplayBackend, wrap_text
 
+if TYPE_CHECKING:
+    from .led_simulator import SimulatorConfig
 
-# Color mapping for alert tiers
-TIER_COLORS = {
-    "informational": LEDColor.BLUE.value,
-    "advisory": LEDColor.GREEN.value,
-    "warning": LEDColor.AMBER.value,
-    "emergency": LEDColor.RED.value,
-    "ipaws": LEDColor.RED.value,
+# led_simulator (and numpy with it) is imported on first use, so that
+# console-only consumers can import this module without loading it
+_led_simulator = None
+
+# Color mapping for alert tiers, by LEDColor member name
+_TIER_COLOR_NAMES = {
+    "informational": "BLUE",
+    "advisory": "GREEN",
+    "warning": "AMBER",
+    "emergency": "RED",
+    "ipaws": "RED",
 }
+_DEFAULT_COLOR_NAME = "GREEN"
+
+
+def _load_led_simulator():
+    """Import the led_simulator module on first use."""
+    global _led_simulator
+    if _led_simulator is None:
+        from . import led_simulator
+        _led_simulator = led_simulator
+    return _led_simulator
+
+
+def _tier_colors() -> Dict[str, tuple]:
+    """Resolve TIER_COLORS to RGB tuples (once)."""
+    colors = globals().get("TIER_COLORS")
+    if colors is None:
+        led_color = _load_led_simulator().LEDColor
+        colors = {tier: led_color[name].value for tier, name in _TIER_COLOR_NAMES.items()}
+        globals()["TIER_COLORS"] = colors
+    return colors
+
+
+def __getattr__(name: str) -> Any:
+    # TIER_COLORS and the re-exported simulator names resolve lazily
+    if name == "TIER_COLORS":
+        return _tier_colors()
+    if name in ("LEDSimulator", "LEDColor", "SimulatorConfig"):
+        return getattr(_load_led_simulator(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SimulatorDisplayBackend(SecureDisplayBackend):
@@ -28,15 +62,19 @@ class SimulatorDisplayBackend(SecureDisplayBackend):
     used with SecureDisplayEngine (which enforces signatures).
     """
     
-    def __init__(self, config: Optional[SimulatorConfig] = None):
+    def __init__(self, config: Optional["SimulatorConfig"] = None):
         """
         Initialize simulator backend.
         
         Args:
             config: Optional simulator configuration
         """
-        self.config = config or SimulatorConfig()
-        self.simulator = LEDSimulator(self.config)
+        led = _load_led_simulator()
+        self.config = config or led.SimulatorConfig()
+        self._max_chars = self.config.width // 6  # 6 pixels per character
+        self.simulator = led.LEDSimulator(self.config)
+        self._tier_colors = _tier_colors()
+        self._default_color = led.LEDColor[_DEFAULT_COLOR_NAME].value
         self._current_tier: Optional[str] = None
         self._initialized = False
     
@@ -66,7 +104,7 @@ class SimulatorDisplayBackend(SecureDisplayBackend):
         
         # Get color based on tier (stored by SecureDisplayEngine)
         tier = content.get("_tier", "informational")
-        color = TIER_COLORS.get(tier, LEDColor.GREEN.value)
+        color = self._tier_colors.get(tier, self._default_color)
         
         # Render text centered
         self._render_multiline(text, color)
@@ -98,25 +136,9 @@ class SimulatorDisplayBackend(SecureDisplayBackend):
     
     def _render_multiline(self, text: str, color: tuple) -> None:
         """Render text, splitting into multiple lines if needed."""
-        max_chars = self.config.width // 6  # 6 pixels per character
-        
-        # Split into lines
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            if len(current_line) + len(word) + 1 <= max_chars:
-                current_line += (" " if current_line else "") + word
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-        
-        # Limit to 3 lines (what fits on 32-pixel height with 7-pixel font + spacing)
-        lines = lines[:3]
+        # Split into lines, limited to 3 (what fits on 32-pixel height
+        # with 7-pixel font + spacing)
+        lines = wrap_text(text, self._max_chars, max_lines=3)
         
         # Calculate vertical centering
         total_height = len(lines) * 9  # 7 pixels + 2 spacing
@@ -141,7 +163,7 @@ class SimulatorDisplayBackend(SecureDisplayBackend):
             "height": self.config.height,
             "color": True,
             "backend": "simulator",
-            "max_chars_per_line": self.config.width // 6,
+            "max_chars_per_line": self._max_chars,
             "max_lines": 3,
         }
     
@@ -63,7 +63,7 @@ class CityArraySDK:
         self._running = False
         self._detection_callbacks: List[Callable] = []
         
-        logger.info(f"CITYARRAY SDK initialized for device {device_id}")
+        logger.info("CITYARRAY SDK initialized for device %s", device_id)
     
     def _init_security(self) -> None:
         """Initialize security components."""
@@ -247,9 +247,12 @@ class CityArraySDK:
             try:
                 callback(detection_type, confidence, details or {})
             except Exception as e:
-                logger.error(f"Detection callback error: {e}")
+                logger.error("Detection callback error: %s", e)
         
-        logger.info(f"Detection: {detection_type} (conf={confidence:.2f}) -> tier={tier.value}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Detection: %s (conf=%.2f) -> tier=%s", detection_type, confidence, tier.value
+            )
         
         return tier
     
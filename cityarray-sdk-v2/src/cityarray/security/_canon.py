@@ -0,0 +1,125 @@
+"""
+Canonical JSON Encoding
+
+Signatures and audit hashes are computed over canonical JSON: sorted keys,
+no whitespace, non-ASCII escaped (json.dumps defaults otherwise). These
+bytes are part of the wire format and of every existing audit log, so they
+must never change.
+
+orjson is used as a fast path when installed, but only where its output is
+known to be byte-identical to json.dumps. It differs on non-ASCII text, on
+DEL (0x7f), on float formatting and on NaN/Infinity (emitted as null), and
+it accepts types json.dumps rejects (Enum, UUID, ...). So any value holding
+a float or a non-JSON type, and any output containing one of the others,
+goes through the standard library instead.
+
+loads() is the matching parser for lines this package wrote itself.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    # Types json.dumps would reject (or encode differently) raise instead,
+    # sending them down the json path
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+# Integers orjson.loads cannot hold exactly; it returns them as floats
+_INT64_RANGE = 2 ** 63
+
+
+def _has_float(obj: Any, big_only: bool = False) -> bool:
+    """
+    True if obj holds a float anywhere inside plain dicts, lists and tuples.
+    With big_only, only integral floats of 2**63 or more in magnitude count.
+    """
+    t = type(obj)
+    if t is dict:
+        for value in obj.values():
+            if _has_float(value, big_only):
+                return True
+        return False
+    if t is list or t is tuple:
+        for value in obj:
+            if _has_float(value, big_only):
+                return True
+        return False
+    if isinstance(obj, float):
+        return not big_only or (obj.is_integer() and abs(obj) >= _INT64_RANGE)
+    return False
+
+
+def _orjson_safe(obj: Any) -> bool:
+    """
+    True if obj is built only from dicts with str keys, lists, tuples, str,
+    int, bool and None (exact types, no floats): the values orjson and
+    json.dumps both accept and encode alike.
+    """
+    t = type(obj)
+    if t is str or t is int or t is bool or obj is None:
+        return True
+    if t is dict:
+        for key, value in obj.items():
+            if type(key) is not str or not _orjson_safe(value):
+                return False
+        return True
+    if t is list or t is tuple:
+        for value in obj:
+            if not _orjson_safe(value):
+                return False
+        return True
+    return False
+
+
+def canonical(obj: Any) -> bytes:
+    """
+    Encode obj as canonical JSON bytes.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        ASCII bytes, identical to
+        json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        for every value json.dumps accepts
+    """
+    if ORJSON_AVAILABLE and _orjson_safe(obj):
+        try:
+            out = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Non-str keys, ints beyond 64 bits, passthrough types
+            pass
+        else:
+            if out.isascii() and b'\x7f' not in out:
+                return out
+    return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes, with orjson when installed.
+
+    orjson rejects NaN/Infinity, which json.loads accepts, and reads integers
+    beyond 64 bits as floats; both are parsed with json instead, so the
+    result always equals json.loads(data).
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            value = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            if not _has_float(value, big_only=True):
+                return value
+    return json.loads(data)
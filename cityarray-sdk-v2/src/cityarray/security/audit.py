@@ -11,18 +11,75 @@ Log entries include:
 - Device state at time of event
 """
 
+import os
 import json
+import time
+import queue
+import atexit
 import hashlib
 import logging
 import threading
-from datetime import datetime, timezone
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any, List, Callable
+from datetime import datetime
+from dataclasses import dataclass
+from itertools import islice
+from typing import Optional, Dict, Any, List, Callable, Iterator, Tuple
 from enum import Enum
 from pathlib import Path
 
+from json.encoder import encode_basestring_ascii as _json_str
+
+from ._canon import canonical, loads
+
 logger = logging.getLogger(__name__)
 
+# Chain hash primitive, resolved once. hashlib's sha256 is OpenSSL's when
+# Python is built against it, which already uses the CPU's SHA extensions
+# (SHA-NI / ARMv8 SHA2) where present.
+_sha256 = hashlib.sha256
+
+# False if this Python's sha256 is the bundled fallback (no OpenSSL, or
+# OpenSSL without it), which never uses the CPU's SHA instructions
+_OPENSSL_SHA256 = type(_sha256()).__module__ == "_hashlib"
+
+# fdatasync skips flushing metadata that is not needed to read the data back
+# (mtime etc.); file size is still flushed. Not available on macOS/Windows.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# With O_DSYNC each write() returns only once its data is on disk, saving the
+# separate sync call. Not available on Windows.
+_O_DSYNC = getattr(os, "O_DSYNC", 0)
+
+
+# Formatted date/time for the current second, shared by all loggers
+_second_cache = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as datetime.now(timezone.utc).isoformat() would format
+    it, with 'Z' for '+00:00'. The date/time part is formatted once per second.
+    """
+    global _second_cache
+    secs, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached_secs, base = _second_cache
+    if secs != cached_secs:
+        base = "%04d-%02d-%02dT%02d:%02d:%02d" % time.gmtime(secs)[:6]
+        _second_cache = (secs, base)
+    micros = frac // 1000
+    # isoformat() omits a zero fraction
+    return f"{base}.{micros:06d}Z" if micros else base + "Z"
+
+
+def _merkle_root(leaves: List[bytes]) -> bytes:
+    """SHA-256 Merkle root with domain-separated leaves/nodes; odd nodes pair with themselves."""
+    level = [_sha256(b"\x00" + leaf).digest() for leaf in leaves]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [_sha256(b"\x01" + level[i] + level[i + 1]).digest()
+                 for i in range(0, len(level), 2)]
+    return level[0]
+
 
 class AuditEventType(Enum):
     """Types of auditable events."""
@@ -58,7 +115,23 @@ class AuditEventType(Enum):
     NETWORK_DISCONNECTED = "net_disconnected"
 
 
-@dataclass
+# JSON string form of each event type value, for the hash preimage
+_EVENT_TYPE_JSON = {t.value: _json_str(t.value).encode() for t in AuditEventType}
+
+# Canonical JSON of the hashed fields, keys in sorted order
+_PREIMAGE_TEMPLATE = (
+    b'{"data":%b,"device_id":%b,"event_type":%b,"previous_hash":%b,'
+    b'"sequence":%d,"timestamp":%b}'
+)
+
+# Keys a serialized AuditEvent may carry
+_FIELDS = frozenset((
+    "sequence", "timestamp", "event_type", "device_id", "data",
+    "previous_hash", "entry_hash",
+))
+
+
+@dataclass(slots=True)
 class AuditEvent:
     """A single audit log entry."""
     sequence: int
@@ -71,6 +144,32 @@ class AuditEvent:
     
     def compute_hash(self) -> str:
         """Compute hash of this entry (excluding entry_hash field)."""
+        return _sha256(self._hash_preimage()).hexdigest()
+    
+    def _well_typed(self) -> bool:
+        return (type(self.sequence) is int and type(self.timestamp) is str
+                and type(self.event_type) is str and type(self.device_id) is str
+                and type(self.previous_hash) is str)
+    
+    def _hash_preimage(self, data_json: Optional[bytes] = None) -> bytes:
+        """
+        Canonical JSON of the hashed fields.
+        
+        The top-level keys are fixed, so for well-typed entries the bytes are
+        assembled directly (keys already in sorted order) and only `data` goes
+        through the encoder, unless its canonical form is passed in as
+        data_json. Anything else, e.g. entries read back from a tampered log,
+        takes the generic path. Both produce identical bytes.
+        """
+        if self._well_typed():
+            return _PREIMAGE_TEMPLATE % (
+                canonical(self.data) if data_json is None else data_json,
+                _json_str(self.device_id).encode(),
+                _EVENT_TYPE_JSON.get(self.event_type) or _json_str(self.event_type).encode(),
+                _json_str(self.previous_hash).encode(),
+                self.sequence,
+                _json_str(self.timestamp).encode(),
+            )
         payload = {
             "sequence": self.sequence,
             "timestamp": self.timestamp,
@@ -79,18 +178,54 @@ class AuditEvent:
             "data": self.data,
             "previous_hash": self.previous_hash
         }
-        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+        return canonical(payload)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Field order is the on-disk key order. `data` is shared, not copied.
+        return {
+            "sequence": self.sequence,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "device_id": self.device_id,
+            "data": self.data,
+            "previous_hash": self.previous_hash,
+            "entry_hash": self.entry_hash,
+        }
     
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
     
+    def _json_line(self, data_json: bytes) -> str:
+        """
+        Log file line: to_json() plus newline, with `data` spliced in from its
+        canonical encoding so it is only encoded once per entry. Parses to
+        the same dict as to_json(); only whitespace and key order inside
+        `data` differ.
+        """
+        if not (self._well_typed() and type(self.entry_hash) is str):
+            return self.to_json() + '\n'
+        return (
+            f'{{"sequence": {self.sequence}, "timestamp": {_json_str(self.timestamp)}, '
+            f'"event_type": {_json_str(self.event_type)}, '
+            f'"device_id": {_json_str(self.device_id)}, "data": {data_json.decode()}, '
+            f'"previous_hash": {_json_str(self.previous_hash)}, '
+            f'"entry_hash": {_json_str(self.entry_hash)}}}\n'
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AuditEvent":
-        return cls(**data)
+        unexpected = data.keys() - _FIELDS
+        if unexpected:
+            raise ValueError(f"Unexpected audit event fields: {sorted(unexpected)}")
+        return cls(
+            data["sequence"],
+            data["timestamp"],
+            data["event_type"],
+            data["device_id"],
+            data["data"],
+            data["previous_hash"],
+            data.get("entry_hash"),
+        )
     
     @classmethod
     def from_json(cls, json_str: str) -> "AuditEvent":
@@ -104,18 +239,41 @@ class AuditLogger:
     Security Properties:
     - Each entry includes hash of previous entry
     - Modification of any entry breaks the chain
-    - Entries are flushed immediately (no buffering)
+    - Entries are flushed immediately (no buffering), unless background
+      writes are enabled, in which case they are flushed by a writer thread
+      in small batches (call flush()/close() before relying on the file)
+    - With durable=True every write is synced to disk; background writes share one
+      fsync per batch
+    - Every SEGMENT_SIZE entries, a Merkle root over the segment's entry
+      hashes is appended to a sidecar file (<log>.merkle), so a single
+      segment can be checked with verify_segment() without a full replay
+    - verify_chain(incremental=True) checks only what was appended since
+      the last pass, re-checking the link at the boundary
     - Remote sync capability for off-device backup
     """
     
     # Genesis hash for first entry in chain
     GENESIS_HASH = "0" * 64
     
+    # Max entries the background writer appends per write
+    WRITE_BATCH_SIZE = 64
+    
+    # Entries parsed and re-hashed per step when replaying the log
+    VERIFY_BATCH_SIZE = 256
+    
+    # Read buffer for scanning the log file
+    READ_BUFFER_SIZE = 1 << 20
+    
+    # Entries per Merkle segment
+    SEGMENT_SIZE = 1024
+    
     def __init__(
         self,
         device_id: str,
         log_path: Optional[Path] = None,
-        remote_callback: Optional[Callable[[AuditEvent], None]] = None
+        remote_callback: Optional[Callable[[AuditEvent], None]] = None,
+        background_writes: bool = False,
+        durable: bool = False
     ):
         """
         Initialize audit logger.
@@ -123,18 +281,59 @@ class AuditLogger:
         Args:
             device_id: This device's ID
             log_path: Path to local log file (default: ./audit.log)
-            remote_callback: Optional callback for remote sync
+            remote_callback: Optional callback for remote sync. Called after
+                             the entry is chained, without holding the
+                             logger lock, so calls from concurrent threads
+                             may arrive out of sequence order.
+            background_writes: Append to the log file from a writer thread so
+                               log() does not block on disk I/O. The chain is
+                               still built synchronously in log().
+            durable: Sync the log file to disk after each write (after each
+                     batch with background writes)
         """
+        if not _OPENSSL_SHA256:
+            logger.warning(
+                "hashlib.sha256 is not OpenSSL-backed - audit hashing will not "
+                "use hardware SHA acceleration"
+            )
+        
         self.device_id = device_id
         self.log_path = log_path or Path("./audit.log")
         self.remote_callback = remote_callback
+        self.durable = durable
+        
+        # Append-only descriptor, opened on first write and kept open
+        self._fd: Optional[int] = None
+        
+        self.merkle_path = self.log_path.with_name(self.log_path.name + ".merkle")
         
         self._lock = threading.Lock()
         self._sequence = 0
         self._last_hash = self.GENESIS_HASH
         
+        # Entry hashes of the open Merkle segment, and the log size in bytes
+        # (where the next entry starts)
+        self._segment_hashes: List[str] = []
+        self._segment_offset = 0
+        self._log_size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        
+        # Last entry of the intact prefix found by verify_chain(): its byte
+        # offset and its previous_hash; incremental passes resume there
+        self._verified_checkpoint: Optional[Tuple[int, str]] = None
+        
+        self._write_queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        
         # Load existing log to continue chain
         self._load_existing()
+        
+        if background_writes:
+            self._write_queue = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="audit-writer", daemon=True
+            )
+            self._writer.start()
+            atexit.register(self.close)
     
     def _load_existing(self) -> None:
         """Load existing log file and verify chain integrity."""
@@ -143,14 +342,9 @@ class AuditLogger:
             return
         
         try:
-            with open(self.log_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    event = AuditEvent.from_json(line)
-                    
+            for offsets, events in self._read_batches():
+                hashes = self._verify_batch(events)
+                for offset, event, computed_hash in zip(offsets, events, hashes):
                     # Verify chain
                     if event.previous_hash != self._last_hash:
                         logger.error(f"AUDIT CHAIN BROKEN at sequence {event.sequence}!")
@@ -167,12 +361,12 @@ class AuditLogger:
                         )
                     
                     # Verify entry hash
-                    computed_hash = event.compute_hash()
                     if event.entry_hash != computed_hash:
                         logger.error(f"AUDIT ENTRY TAMPERED at sequence {event.sequence}!")
                     
                     self._sequence = event.sequence
                     self._last_hash = event.entry_hash or computed_hash
+                    self._track_segment(event.sequence, self._last_hash, offset)
             
             logger.info(f"Loaded audit log with {self._sequence} entries")
             
@@ -182,6 +376,31 @@ class AuditLogger:
             self._sequence = 0
             self._last_hash = self.GENESIS_HASH
     
+    def _read_batches(self, offset: int = 0) -> Iterator[Tuple[List[int], List[AuditEvent]]]:
+        """
+        Parse the log file in order from a byte offset, VERIFY_BATCH_SIZE
+        lines at a time, yielding each batch with its entries' byte offsets.
+        """
+        with open(self.log_path, 'rb', buffering=self.READ_BUFFER_SIZE) as f:
+            f.seek(offset)
+            while True:
+                lines = list(islice(f, self.VERIFY_BATCH_SIZE))
+                if not lines:
+                    return
+                offsets = []
+                events = []
+                for line in lines:
+                    if not line.isspace():
+                        offsets.append(offset)
+                        events.append(AuditEvent.from_dict(loads(line)))
+                    offset += len(line)
+                yield offsets, events
+    
+    @staticmethod
+    def _verify_batch(events: List[AuditEvent]) -> List[str]:
+        """Recompute the entry hashes of a batch of events, in order."""
+        return [event.compute_hash() for event in events]
+    
     def log(
         self,
         event_type: AuditEventType,
@@ -202,8 +421,10 @@ class AuditLogger:
         with self._lock:
             self._sequence += 1
             
-            ts = timestamp or datetime.now(timezone.utc)
-            ts_str = ts.isoformat().replace('+00:00', 'Z')
+            if timestamp is None:
+                ts_str = _utc_now_iso()
+            else:
+                ts_str = timestamp.isoformat().replace('+00:00', 'Z')
             
             event = AuditEvent(
                 sequence=self._sequence,
@@ -214,66 +435,231 @@ class AuditLogger:
                 previous_hash=self._last_hash
             )
             
-            event.entry_hash = event.compute_hash()
+            data_json = canonical(data)
+            event.entry_hash = _sha256(event._hash_preimage(data_json)).hexdigest()
             self._last_hash = event.entry_hash
             
-            # Write immediately (no buffering for security)
-            self._write_event(event)
+            # Write immediately (no buffering for security). Serialized here,
+            # under the lock, so later changes to `data` cannot reach the file.
+            line = event._json_line(data_json)
+            offset = self._log_size
+            self._log_size += len(line)  # ASCII: json.dumps escapes the rest
+            if self._write_queue is not None:
+                self._write_queue.put(line)
+            else:
+                self._write_lines([line])
             
-            # Remote sync if configured
-            if self.remote_callback:
-                try:
-                    self.remote_callback(event)
-                except Exception as e:
-                    logger.error(f"Remote audit sync failed: {e}")
-            
-            return event
+            if self._track_segment(event.sequence, event.entry_hash, offset):
+                self._write_segment_root()
+        
+        # Remote sync if configured. Outside the lock so a slow network does
+        # not stall other loggers; entries carry their sequence numbers.
+        if self.remote_callback:
+            try:
+                self.remote_callback(event)
+            except Exception as e:
+                logger.error(f"Remote audit sync failed: {e}")
+        
+        return event
+    
+    def _track_segment(self, sequence: int, entry_hash: str, offset: int) -> bool:
+        """Add an entry to the open segment; True when the segment is complete."""
+        if (sequence - 1) % self.SEGMENT_SIZE == 0:
+            self._segment_hashes = []
+            self._segment_offset = offset
+        self._segment_hashes.append(entry_hash)
+        return sequence % self.SEGMENT_SIZE == 0 and len(self._segment_hashes) == self.SEGMENT_SIZE
+    
+    def _write_segment_root(self) -> None:
+        """Append the completed segment's Merkle root to the sidecar file."""
+        record = {
+            "seq_start": self._sequence - self.SEGMENT_SIZE + 1,
+            "seq_end": self._sequence,
+            "offset": self._segment_offset,  # Log file byte offset of seq_start
+            "root": _merkle_root([h.encode() for h in self._segment_hashes]).hex(),
+        }
+        try:
+            with open(self.merkle_path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        except Exception as e:
+            logger.error(f"Failed to write audit segment root: {e}")
     
-    def _write_event(self, event: AuditEvent) -> None:
-        """Write event to local log file."""
+    def _write_lines(self, lines: List[str]) -> None:
+        """Append serialized entries to the local log file."""
         try:
-            with open(self.log_path, 'a') as f:
-                f.write(event.to_json() + '\n')
-                f.flush()  # Force write to disk
+            if self._fd is None:
+                flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                if self.durable:
+                    flags |= _O_DSYNC
+                self._fd = os.open(self.log_path, flags, 0o600)
+            data = memoryview(''.join(lines).encode('utf-8'))
+            while data:
+                data = data[os.write(self._fd, data):]
+            if self.durable and not _O_DSYNC:
+                _datasync(self._fd)
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
     
-    def verify_chain(self) -> tuple[bool, List[int]]:
+    def _writer_loop(self) -> None:
+        """Background writer: append queued entries in batches, in order."""
+        while True:
+            batch = [self._write_queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [item for item in batch if isinstance(item, str)]
+            if lines:
+                self._write_lines(lines)
+            
+            # Flush waiters queued behind these entries; None means stop
+            stop = False
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif not isinstance(item, str):
+                    item.set()
+            if stop:
+                return
+    
+    def flush(self) -> None:
+        """Block until every entry logged so far has been written."""
+        done = threading.Event()
+        # Queued under the lock, so it lands ahead of close()'s stop marker
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                return
+            self._write_queue.put(done)
+        done.wait()
+    
+    def close(self) -> None:
+        """
+        Write pending entries, stop the background writer (if any) and close
+        the log file. Safe to call more than once; entries logged afterwards
+        are written synchronously.
+        """
+        with self._lock:
+            # Drained under the lock, so no later entry can be written ahead
+            # of the queued ones
+            if self._writer is not None:
+                if self._writer.is_alive():
+                    self._write_queue.put(None)
+                    self._writer.join()
+                self._writer = None
+                self._write_queue = None
+                atexit.unregister(self.close)  # Drop the registry's reference
+            self._close_fd()
+    
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+    
+    def __del__(self):
+        try:
+            self._close_fd()
+        except Exception:
+            pass
+    
+    def verify_chain(self, incremental: bool = False) -> tuple[bool, List[int]]:
         """
         Verify entire audit chain integrity.
         
+        Args:
+            incremental: Resume from the end of the intact prefix found by
+                         the previous verify_chain() call on this logger,
+                         instead of from the start. The last entry checked
+                         before is checked again, so new entries must link
+                         onto it; entries before it are not re-read, so
+                         use a full pass to detect edits to those.
+        
         Returns:
             Tuple of (is_valid, list_of_broken_sequences)
         """
+        self.flush()
         broken = []
-        last_hash = self.GENESIS_HASH
+        offset, last_hash = 0, self.GENESIS_HASH
+        resumed = incremental and self._verified_checkpoint is not None
+        if resumed:
+            offset, last_hash = self._verified_checkpoint
+        checkpoint = self._verified_checkpoint if incremental else None
         
         try:
-            with open(self.log_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    event = AuditEvent.from_json(line)
+            if resumed and self.log_path.stat().st_size <= offset:
+                raise ValueError("log truncated below the verified checkpoint")
+            for offsets, events in self._read_batches(offset):
+                for entry_offset, event, computed in zip(offsets, events, self._verify_batch(events)):
+                    intact = not broken
                     
                     # Check chain link
                     if event.previous_hash != last_hash:
                         broken.append(event.sequence)
                     
                     # Check entry integrity
-                    computed = event.compute_hash()
                     if event.entry_hash != computed:
                         broken.append(event.sequence)
                     
+                    if intact and not broken:
+                        checkpoint = (entry_offset, event.previous_hash)
                     last_hash = event.entry_hash or computed
             
+            self._verified_checkpoint = checkpoint
             return len(broken) == 0, broken
             
         except Exception as e:
             logger.error(f"Chain verification failed: {e}")
+            self._verified_checkpoint = None
             return False, [-1]  # -1 indicates file-level error
     
+    def verify_segment(self, sequence: int) -> bool:
+        """
+        Verify the Merkle segment containing a sequence number.
+        
+        Re-reads only that segment: checks its entry hashes, the chain links
+        inside it, and its Merkle root against the sidecar file. Chain links
+        across segments are covered by verify_chain().
+        
+        Args:
+            sequence: Any sequence number in the segment
+            
+        Returns:
+            True if the segment is complete, recorded and intact
+        """
+        self.flush()
+        seq_start = (sequence - 1) // self.SEGMENT_SIZE * self.SEGMENT_SIZE + 1
+        
+        try:
+            record = None
+            with open(self.merkle_path, 'rb') as f:
+                for line in f:
+                    if not line.isspace():
+                        candidate = loads(line)
+                        if candidate["seq_start"] == seq_start:
+                            record = candidate
+            if record is None:
+                return False
+            
+            events: List[AuditEvent] = []
+            for _, batch in self._read_batches(record["offset"]):
+                events.extend(batch)
+                if len(events) >= self.SEGMENT_SIZE:
+                    break
+            events = events[:self.SEGMENT_SIZE]
+        except Exception as e:
+            logger.error(f"Segment verification failed: {e}")
+            return False
+        
+        if [e.sequence for e in events] != list(range(seq_start, seq_start + self.SEGMENT_SIZE)):
+            return False
+        hashes = self._verify_batch(events)
+        if any(event.entry_hash != computed for event, computed in zip(events, hashes)):
+            return False
+        if any(b.previous_hash != a.entry_hash for a, b in zip(events, events[1:])):
+            return False
+        return _merkle_root([h.encode() for h in hashes]).hex() == record["root"]
+    
     def get_entries(
         self,
         since_sequence: int = 0,
@@ -291,20 +677,20 @@ class AuditLogger:
         Returns:
             List of audit events
         """
+        self.flush()
         entries = []
         type_values = {t.value for t in event_types} if event_types else None
         
         try:
-            with open(self.log_path, 'r') as f:
+            with open(self.log_path, 'rb', buffering=self.READ_BUFFER_SIZE) as f:
                 for line in f:
                     if len(entries) >= limit:
                         break
                     
-                    line = line.strip()
-                    if not line:
+                    if line.isspace():
                         continue
                     
-                    event = AuditEvent.from_json(line)
+                    event = AuditEvent.from_dict(loads(line))
                     
                     if event.sequence <= since_sequence:
                         continue
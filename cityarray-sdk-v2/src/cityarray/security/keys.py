@@ -15,26 +15,57 @@ Key Hierarchy:
 
 import os
 import json
+import base64
 import logging
+import hmac
 import hashlib
 import secrets
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-# Try to import cryptography
+# cryptography is imported on first use by _load_crypto(); None until then
+CRYPTO_AVAILABLE: Optional[bool] = None
+
+
+def _load_crypto() -> bool:
+    """Import cryptography once; returns CRYPTO_AVAILABLE."""
+    global CRYPTO_AVAILABLE, Ed25519PrivateKey, serialization, AESGCM, Scrypt
+    if CRYPTO_AVAILABLE is not None:
+        return CRYPTO_AVAILABLE
+    
+    try:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+        available = True
+    except ImportError:
+        available = False
+        logger.warning("cryptography library not available")
+    
+    CRYPTO_AVAILABLE = available
+    return available
+
+
+# Optional OS keyring (Keychain, Secret Service, Windows Credential Locker)
 try:
-    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-    from cryptography.hazmat.primitives import serialization
-    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
-    CRYPTO_AVAILABLE = True
+    import keyring
+    KEYRING_AVAILABLE = True
 except ImportError:
-    CRYPTO_AVAILABLE = False
-    logger.warning("cryptography library not available")
+    KEYRING_AVAILABLE = False
+
+# Scrypt-derived storage keys, by store (resolved path and salt). The KDF is
+# deliberately slow; stores reopened within a process skip it. Each key is
+# kept with an HMAC of the password under the key itself, so reopening with
+# a different password misses and derives afresh.
+_KEK_CACHE: Dict[Tuple[str, bytes], Tuple[bytes, bytes]] = {}
+_KEK_CACHE_LOCK = threading.Lock()
+_KEYRING_SERVICE = "cityarray"
 
 
 @dataclass
@@ -66,6 +97,10 @@ class KeyStore(ABC):
         """Sign data with the specified key."""
         pass
     
+    def sign_batch(self, key_id: str, items: List[bytes]) -> List[bytes]:
+        """Sign several payloads with the same key."""
+        return [self.sign(key_id, data) for data in items]
+    
     @abstractmethod
     def list_keys(self) -> list[KeyInfo]:
         """List all keys in the store."""
@@ -87,21 +122,34 @@ class SoftwareKeyStore(KeyStore):
     where keys must be protected by HSM.
     """
     
-    def __init__(self, storage_path: Path, password: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Path,
+        password: Optional[str] = None,
+        reuse_kek: bool = False
+    ):
         """
         Initialize software key store.
         
         Args:
             storage_path: Directory to store encrypted keys
             password: Password for key encryption (prompts if None)
+            reuse_kek: Also keep the derived storage key in the OS keyring
+                       (requires the `keyring` extra) so later processes
+                       skip the scrypt derivation. Anyone who can read the
+                       user's keyring can then decrypt the stored keys.
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.reuse_kek = reuse_kek
         
+        # Key files on disk, by ID; decrypted on first use into _keys
+        self._key_index: Dict[str, Path] = {}
         self._keys: Dict[str, Any] = {}
+        self._private_keys: Dict[str, Any] = {}  # key_id -> Ed25519PrivateKey
         self._encryption_key: Optional[bytes] = None
         
-        if CRYPTO_AVAILABLE:
+        if _load_crypto():
             self._init_encryption(password)
             self._load_keys()
         else:
@@ -122,8 +170,85 @@ class SoftwareKeyStore(KeyStore):
             salt = secrets.token_bytes(16)
             salt_file.write_bytes(salt)
         
-        kdf = Scrypt(salt=salt, length=32, n=2**14, r=8, p=1)
-        self._encryption_key = kdf.derive(password.encode())
+        # Nothing derived from the password is used as a lookup key: cache
+        # and keyring entries are found by store, then checked against it
+        secret = password.encode()
+        store_id = (str(self.storage_path.resolve()), salt)
+        with _KEK_CACHE_LOCK:
+            cached = _KEK_CACHE.get(store_id)
+        key = self._check_kek(cached, secret)
+        if key is None and self.reuse_kek:
+            key = self._check_kek(self._keyring_get(salt), secret)
+        if key is None:
+            kdf = Scrypt(salt=salt, length=32, n=2**14, r=8, p=1)
+            key = kdf.derive(secret)
+            # A wrong password must not evict the right one's entries
+            if self._opens_store(key):
+                tag = self._password_tag(key, secret)
+                if self.reuse_kek:
+                    self._keyring_set(salt, key, tag)
+                with _KEK_CACHE_LOCK:
+                    _KEK_CACHE[store_id] = (key, tag)
+        self._encryption_key = key
+    
+    @staticmethod
+    def _password_tag(key: bytes, secret: bytes) -> bytes:
+        """HMAC of the password under the storage key derived from it."""
+        return hmac.new(key, secret, hashlib.sha256).digest()
+    
+    def _check_kek(
+        self, entry: Optional[Tuple[bytes, bytes]], secret: bytes
+    ) -> Optional[bytes]:
+        """
+        Return a remembered storage key if it belongs to this password and
+        still decrypts this store's key files, else None.
+        """
+        if entry is None:
+            return None
+        key, tag = entry
+        if not hmac.compare_digest(tag, self._password_tag(key, secret)):
+            return None
+        return key if self._opens_store(key) else None
+    
+    def _opens_store(self, key: bytes) -> bool:
+        """True if key decrypts this store's key files (or there are none yet)."""
+        # One key file is enough: they all share the storage key
+        for key_file in self.storage_path.glob("*.key"):
+            data = key_file.read_bytes()
+            try:
+                AESGCM(key).decrypt(data[:12], data[12:], None)
+            except Exception:
+                return False
+            break
+        return True
+    
+    @staticmethod
+    def _keyring_get(salt: bytes) -> Optional[Tuple[bytes, bytes]]:
+        """Fetch a derived storage key and its password tag from the OS keyring."""
+        if not KEYRING_AVAILABLE:
+            return None
+        try:
+            stored = keyring.get_password(_KEYRING_SERVICE, f"kek-{salt.hex()}")
+            if stored is None:
+                return None
+            value = base64.b64decode(stored)
+            return (value[:32], value[32:]) if len(value) == 64 else None
+        except Exception as e:
+            logger.warning(f"Keyring lookup failed: {e}")
+            return None
+    
+    @staticmethod
+    def _keyring_set(salt: bytes, key: bytes, tag: bytes) -> None:
+        """Store a derived storage key in the OS keyring (best effort)."""
+        if not KEYRING_AVAILABLE:
+            logger.warning("reuse_kek requested but keyring is not installed")
+            return
+        try:
+            keyring.set_password(
+                _KEYRING_SERVICE, f"kek-{salt.hex()}", base64.b64encode(key + tag).decode()
+            )
+        except Exception as e:
+            logger.warning(f"Keyring store failed: {e}")
     
     def _encrypt(self, data: bytes) -> bytes:
         """Encrypt data with AES-GCM."""
@@ -146,17 +271,32 @@ class SoftwareKeyStore(KeyStore):
         return aesgcm.decrypt(nonce, ciphertext, None)
     
     def _load_keys(self) -> None:
-        """Load existing keys from disk."""
+        """Index existing keys on disk (decrypted on first use)."""
         for key_file in self.storage_path.glob("*.key"):
-            try:
-                encrypted = key_file.read_bytes()
-                decrypted = self._decrypt(encrypted)
-                key_data = json.loads(decrypted)
-                key_id = key_file.stem
-                self._keys[key_id] = key_data
-                logger.debug(f"Loaded key {key_id}")
-            except Exception as e:
-                logger.error(f"Failed to load key {key_file}: {e}")
+            self._key_index[key_file.stem] = key_file
+    
+    def _materialize(self, key_id: str) -> Dict[str, Any]:
+        """Return a key's data, reading and decrypting it on first use."""
+        key_data = self._keys.get(key_id)
+        if key_data is not None:
+            return key_data
+        
+        key_file = self._key_index.get(key_id)
+        if key_file is None:
+            raise KeyError(f"Key {key_id} not found")
+        try:
+            encrypted = key_file.read_bytes()
+            decrypted = self._decrypt(encrypted)
+            key_data = json.loads(decrypted)
+        except Exception as e:
+            # Treated as absent, as when keys were loaded eagerly
+            logger.error(f"Failed to load key {key_file}: {e}")
+            del self._key_index[key_id]
+            raise KeyError(f"Key {key_id} not found") from e
+        
+        self._keys[key_id] = key_data
+        logger.debug(f"Loaded key {key_id}")
+        return key_data
     
     def _save_key(self, key_id: str, key_data: Dict[str, Any]) -> None:
         """Save a key to disk."""
@@ -164,11 +304,12 @@ class SoftwareKeyStore(KeyStore):
         plaintext = json.dumps(key_data).encode()
         encrypted = self._encrypt(plaintext)
         key_file.write_bytes(encrypted)
+        self._key_index[key_id] = key_file
         self._keys[key_id] = key_data
     
     def generate_signing_key(self, key_id: str) -> KeyInfo:
         """Generate a new Ed25519 signing key pair."""
-        if key_id in self._keys:
+        if key_id in self._key_index:
             raise ValueError(f"Key {key_id} already exists")
         
         from datetime import datetime, timezone
@@ -215,29 +356,34 @@ class SoftwareKeyStore(KeyStore):
     
     def get_public_key(self, key_id: str) -> bytes:
         """Get public key bytes."""
-        if key_id not in self._keys:
-            raise KeyError(f"Key {key_id} not found")
-        
-        return bytes.fromhex(self._keys[key_id]["public_key"])
+        return bytes.fromhex(self._materialize(key_id)["public_key"])
     
     def sign(self, key_id: str, data: bytes) -> bytes:
         """Sign data with Ed25519."""
-        if key_id not in self._keys:
-            raise KeyError(f"Key {key_id} not found")
-        
-        private_bytes = bytes.fromhex(self._keys[key_id]["private_key"])
-        
+        return self.sign_batch(key_id, [data])[0]
+    
+    def sign_batch(self, key_id: str, items: List[bytes]) -> List[bytes]:
+        """Sign several payloads with Ed25519, loading the key once."""
         if CRYPTO_AVAILABLE:
-            private_key = Ed25519PrivateKey.from_private_bytes(private_bytes)
-            return private_key.sign(data)
+            private_key = self._private_keys.get(key_id)
+            if private_key is None:
+                private_bytes = bytes.fromhex(self._materialize(key_id)["private_key"])
+                private_key = Ed25519PrivateKey.from_private_bytes(private_bytes)
+                self._private_keys[key_id] = private_key
+            return [private_key.sign(data) for data in items]
         else:
             # Development stub
-            return hashlib.sha256(private_bytes + data).digest()
+            private_bytes = bytes.fromhex(self._materialize(key_id)["private_key"])
+            return [hashlib.sha256(private_bytes + data).digest() for data in items]
     
     def list_keys(self) -> list[KeyInfo]:
-        """List all keys."""
+        """List all keys (decrypts any not yet loaded)."""
         result = []
-        for key_id, key_data in self._keys.items():
+        for key_id in list(self._key_index):
+            try:
+                key_data = self._materialize(key_id)
+            except KeyError:
+                continue
             result.append(KeyInfo(
                 key_id=key_id,
                 key_type=key_data["key_type"],
@@ -250,14 +396,15 @@ class SoftwareKeyStore(KeyStore):
     
     def delete_key(self, key_id: str) -> bool:
         """Delete a key."""
-        if key_id not in self._keys:
+        key_file = self._key_index.pop(key_id, None)
+        if key_file is None:
             return False
         
-        key_file = self.storage_path / f"{key_id}.key"
         if key_file.exists():
             key_file.unlink()
         
-        del self._keys[key_id]
+        self._keys.pop(key_id, None)
+        self._private_keys.pop(key_id, None)
         logger.info(f"Deleted key {key_id}")
         return True
 
@@ -323,6 +470,13 @@ class HSMKeyStore(KeyStore):
         
         raise NotImplementedError(f"HSM provider {self.provider} not implemented")
     
+    def sign_batch(self, key_id: str, items: List[bytes]) -> List[bytes]:
+        """Sign several payloads using key in HSM."""
+        if self.provider == "stub":
+            return self._stub_store.sign_batch(key_id, items)
+        
+        raise NotImplementedError(f"HSM provider {self.provider} not implemented")
+    
     def list_keys(self) -> list[KeyInfo]:
         """List keys in HSM."""
         if self.provider == "stub":
@@ -373,6 +527,11 @@ class KeyManager:
         kid = key_id or self.default_key_id
         return self.store.sign(kid, data)
     
+    def sign_many(self, items: List[bytes], key_id: Optional[str] = None) -> List[bytes]:
+        """Sign several payloads with the specified or default key."""
+        kid = key_id or self.default_key_id
+        return self.store.sign_batch(kid, items)
+    
     def rotate_key(self, new_key_id: Optional[str] = None) -> KeyInfo:
         """
         Rotate the signing key.
@@ -10,28 +10,105 @@ Security Properties:
 - Expiration prevents stale message display
 """
 
+import os
 import json
 import hashlib
-import secrets
 import logging
+import time
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
+from json.encoder import encode_basestring_ascii as _json_str
+
+from ._canon import canonical
+
 logger = logging.getLogger(__name__)
 
-# Try to import cryptography library, fall back to stub for development
-try:
-    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
-        Ed25519PrivateKey, Ed25519PublicKey
-    )
-    from cryptography.hazmat.primitives import serialization
-    from cryptography.exceptions import InvalidSignature
-    CRYPTO_AVAILABLE = True
-except ImportError:
-    CRYPTO_AVAILABLE = False
-    logger.warning("cryptography library not available - using development stubs")
+# cryptography (and PyNaCl, used in place of cryptography's Ed25519 verify
+# when installed) are imported on first use by _load_crypto(), so importing
+# this module stays cheap; both are None until then.
+CRYPTO_AVAILABLE: Optional[bool] = None
+NACL_AVAILABLE: Optional[bool] = None
+
+
+def _load_crypto() -> bool:
+    """Import the crypto backends once; returns CRYPTO_AVAILABLE."""
+    global CRYPTO_AVAILABLE, NACL_AVAILABLE
+    global Ed25519PrivateKey, Ed25519PublicKey, serialization, InvalidSignature
+    global NaclVerifyKey, NaclBadSignatureError
+    if CRYPTO_AVAILABLE is not None:
+        return CRYPTO_AVAILABLE
+    
+    # Try to import cryptography library, fall back to stub for development
+    try:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PrivateKey, Ed25519PublicKey
+        )
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.exceptions import InvalidSignature
+        available = True
+    except ImportError:
+        available = False
+        logger.warning("cryptography library not available - using development stubs")
+    
+    try:
+        from nacl.signing import VerifyKey as NaclVerifyKey
+        from nacl.exceptions import BadSignatureError as NaclBadSignatureError
+        NACL_AVAILABLE = True
+    except ImportError:
+        NACL_AVAILABLE = False
+    
+    CRYPTO_AVAILABLE = available
+    return available
+
+
+# Merkle batch signing: domain-separated leaf/node hashes, and a prefix on the
+# signed root so a root signature can never be mistaken for a payload signature.
+_MERKLE_LEAF = b"\x00"
+_MERKLE_NODE = b"\x01"
+_MERKLE_ROOT_PREFIX = b"CITYARRAY-MERKLE-ROOT-V1:"
+_MERKLE_HASH_SIZE = 32
+
+# Hex length of an Ed25519 signature
+_SIGNATURE_HEX_LENGTH = 128
+
+
+def _merkle_leaf(payload: bytes) -> bytes:
+    return hashlib.blake2b(_MERKLE_LEAF + payload, digest_size=_MERKLE_HASH_SIZE).digest()
+
+
+def _merkle_parent(left: bytes, right: bytes) -> bytes:
+    return hashlib.blake2b(_MERKLE_NODE + left + right, digest_size=_MERKLE_HASH_SIZE).digest()
+
+
+# Canonical signed payload and authorization layouts, keys in sorted order
+_PAYLOAD_TEMPLATE = (
+    b'{"authorizations":%b,"content":%b,"device_id":%b,"expires":%b,'
+    b'"message_id":%b,"nonce":%b,"tier":%b,"timestamp":%b}'
+)
+_AUTHORIZATION_TEMPLATE = b'{"method":%b,"operator_id":%b,"timestamp":%b}'
+
+
+def _canonical_authorizations(authorizations: List["Authorization"]) -> bytes:
+    """Canonical JSON of a payload's authorization list."""
+    parts = []
+    for a in authorizations:
+        if type(a.method) is str and type(a.operator_id) is str and type(a.timestamp) is str:
+            parts.append(_AUTHORIZATION_TEMPLATE % (
+                _json_str(a.method).encode(),
+                _json_str(a.operator_id).encode(),
+                _json_str(a.timestamp).encode(),
+            ))
+        else:
+            parts.append(canonical(
+                {"method": a.method, "operator_id": a.operator_id, "timestamp": a.timestamp}
+            ))
+    return b"[" + b",".join(parts) + b"]"
 
 
 class SignatureError(Exception):
@@ -49,7 +126,7 @@ class ReplayDetectedError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Authorization:
     """Record of an authorization for a message."""
     operator_id: str
@@ -57,20 +134,24 @@ class Authorization:
     method: str = "dashboard"  # dashboard, api, auto
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"operator_id": self.operator_id, "timestamp": self.timestamp, "method": self.method}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Authorization":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class SignedMessage:
     """
     A cryptographically signed display message.
     
     All fields except 'signature' are included in the signed payload.
     The signature covers the canonical JSON representation.
+    
+    Messages signed as part of a batch (MessageSigner.sign_batch) also carry
+    'merkle_proof' and 'merkle_index'; their signature then covers the root
+    of a Merkle tree over the batch's payloads.
     """
     message_id: str
     device_id: str
@@ -81,24 +162,87 @@ class SignedMessage:
     content: Dict[str, Any]
     authorizations: List[Authorization] = field(default_factory=list)
     signature: Optional[str] = None
+    merkle_proof: Optional[List[str]] = None  # Sibling hashes (hex), leaf to root
+    merkle_index: Optional[int] = None
+    
+    # Canonical content bytes, shared by signing, verification and audit hashing
+    _canonical_content: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Payload bytes from the last payload_for_signing() call
+    _signed_payload: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Parsed 'expires' as a Unix timestamp, and the string it was parsed from
+    _expires_epoch: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _expires_source: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def canonical_content(self) -> bytes:
+        """
+        Canonical JSON of the content, as embedded in the signed payload.
+        
+        Refreshed by every payload_for_signing() call, so after sign() or
+        verify() it matches exactly the bytes that were signed or checked.
+        """
+        if self._canonical_content is None:
+            self._canonical_content = canonical(self.content)
+        return self._canonical_content
+    
+    @property
+    def signed_payload(self) -> bytes:
+        """
+        Canonical payload, as last signed or verified.
+        
+        Cached like canonical_content, for consumers that need the payload
+        bytes after sign() or verify(). Signature checks never use it; they
+        always call payload_for_signing().
+        """
+        if self._signed_payload is None:
+            return self.payload_for_signing()
+        return self._signed_payload
     
     def payload_for_signing(self) -> bytes:
         """Generate canonical payload for signing (excludes signature field)."""
-        payload = {
-            "message_id": self.message_id,
-            "device_id": self.device_id,
-            "timestamp": self.timestamp,
-            "expires": self.expires,
-            "nonce": self.nonce,
-            "tier": self.tier,
-            "content": self.content,
-            "authorizations": [a.to_dict() for a in self.authorizations]
-        }
-        # Canonical JSON: sorted keys, no whitespace
-        return json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        # Always re-serialize content: a stale cache must never reach a signature check
+        self._canonical_content = canonical(self.content)
+        
+        # Canonical JSON: sorted keys, no whitespace. The keys are fixed, so
+        # for str fields the payload is filled into a template in sorted key
+        # order; otherwise it goes through canonical() piecewise. Both are
+        # byte-identical to dumping the whole payload dict with sort_keys.
+        fields = (
+            self.device_id, self.expires, self.message_id, self.nonce, self.tier, self.timestamp
+        )
+        if all(type(value) is str for value in fields):
+            self._signed_payload = _PAYLOAD_TEMPLATE % (
+                _canonical_authorizations(self.authorizations),
+                self._canonical_content,
+                *[_json_str(value).encode() for value in fields],
+            )
+        else:
+            # "authorizations" < "content" < every other key
+            rest = canonical({
+                "message_id": self.message_id,
+                "device_id": self.device_id,
+                "timestamp": self.timestamp,
+                "expires": self.expires,
+                "nonce": self.nonce,
+                "tier": self.tier,
+            })
+            self._signed_payload = b"".join((
+                b'{"authorizations":', _canonical_authorizations(self.authorizations),
+                b',"content":', self._canonical_content,
+                b',', rest[1:],
+            ))
+        return self._signed_payload
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "message_id": self.message_id,
             "device_id": self.device_id,
             "timestamp": self.timestamp,
@@ -109,6 +253,10 @@ class SignedMessage:
             "authorizations": [a.to_dict() for a in self.authorizations],
             "signature": self.signature
         }
+        if self.merkle_proof is not None:
+            data["merkle_proof"] = self.merkle_proof
+            data["merkle_index"] = self.merkle_index
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SignedMessage":
@@ -124,13 +272,36 @@ class SignedMessage:
             tier=data["tier"],
             content=data["content"],
             authorizations=authorizations,
-            signature=data.get("signature")
+            signature=data.get("signature"),
+            merkle_proof=data.get("merkle_proof"),
+            merkle_index=data.get("merkle_index")
         )
     
-    def is_expired(self) -> bool:
-        """Check if message has expired."""
-        expires_dt = datetime.fromisoformat(self.expires.replace('Z', '+00:00'))
-        return datetime.now(timezone.utc) > expires_dt
+    def is_expired(self, now_ns: Optional[int] = None) -> bool:
+        """
+        Check if message has expired.
+        
+        Args:
+            now_ns: Current time as time.time_ns() (None = read the clock)
+        """
+        if now_ns is None:
+            return time.time() > self.expires_epoch
+        return now_ns / 1e9 > self.expires_epoch
+    
+    @property
+    def expires_epoch(self) -> float:
+        """
+        'expires' as a Unix timestamp.
+        
+        Parsed once and cached alongside the string it came from, so
+        reassigning 'expires' invalidates it.
+        """
+        if self._expires_source is not self.expires:
+            self._expires_epoch = datetime.fromisoformat(
+                self.expires.replace('Z', '+00:00')
+            ).timestamp()
+            self._expires_source = self.expires
+        return self._expires_epoch
     
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
@@ -156,7 +327,7 @@ class MessageSigner:
             private_key: Ed25519 private key bytes (32 bytes seed or 64 bytes full)
                         If None, generates a new key (development only!)
         """
-        if not CRYPTO_AVAILABLE:
+        if not _load_crypto():
             logger.warning("Crypto not available - signatures will be development stubs")
             self._private_key = None
             self._public_key_bytes = b"DEVELOPMENT_PUBLIC_KEY_STUB_32B"
@@ -188,19 +359,61 @@ class MessageSigner:
         Returns:
             Same message with signature field populated
         """
-        payload = message.payload_for_signing()
+        message.merkle_proof = None
+        message.merkle_index = None
+        message.signature = self._sign_bytes(message.payload_for_signing(), message.message_id)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Signed message %s for device %s", message.message_id, message.device_id)
+        return message
+    
+    def sign_batch(self, messages: List[SignedMessage]) -> List[SignedMessage]:
+        """
+        Sign a batch of messages with a single Ed25519 signature.
+        
+        Builds a Merkle tree over the messages' canonical payloads and signs
+        its root once. Each message gets the root signature plus its own
+        inclusion proof, so it can still be verified on its own. A batch of
+        one is signed normally.
         
+        Args:
+            messages: Messages to sign (signature and Merkle fields are set)
+            
+        Returns:
+            The same messages, signed
+        """
+        if len(messages) <= 1:
+            return [self.sign(message) for message in messages]
+        
+        level = [_merkle_leaf(m.payload_for_signing()) for m in messages]
+        positions = list(range(len(messages)))
+        proofs: List[List[str]] = [[] for _ in messages]
+        
+        while len(level) > 1:
+            if len(level) % 2:
+                level.append(level[-1])  # Odd node is paired with itself
+            for i, pos in enumerate(positions):
+                proofs[i].append(level[pos ^ 1].hex())
+                positions[i] = pos >> 1
+            level = [_merkle_parent(level[j], level[j + 1]) for j in range(0, len(level), 2)]
+        
+        signature = self._sign_bytes(_MERKLE_ROOT_PREFIX + level[0], f"batch of {len(messages)}")
+        
+        for i, message in enumerate(messages):
+            message.signature = signature
+            message.merkle_proof = proofs[i]
+            message.merkle_index = i
+        
+        logger.info("Signed batch of %s messages", len(messages))
+        return messages
+    
+    def _sign_bytes(self, data: bytes, label: str) -> str:
+        """Sign raw bytes, returning the hex signature (or a development stub)."""
         if not CRYPTO_AVAILABLE or self._private_key is None:
             # Development stub - NOT SECURE
-            stub_sig = hashlib.sha256(payload).hexdigest()
-            message.signature = f"DEV:{stub_sig}"
-            logger.warning(f"Using development stub signature for message {message.message_id}")
-        else:
-            signature = self._private_key.sign(payload)
-            message.signature = signature.hex()
-        
-        logger.info(f"Signed message {message.message_id} for device {message.device_id}")
-        return message
+            logger.warning("Using development stub signature for message %s", label)
+            return f"DEV:{hashlib.sha256(data).hexdigest()}"
+        return self._private_key.sign(data).hex()
     
     def create_signed_message(
         self,
@@ -224,17 +437,20 @@ class MessageSigner:
             Signed message ready for transmission
         """
         now = datetime.now(timezone.utc)
+        expires = now + timedelta(seconds=ttl_seconds)
         
         message = SignedMessage(
-            message_id=secrets.token_hex(16),
+            message_id=os.urandom(16).hex(),
             device_id=device_id,
             timestamp=now.isoformat().replace('+00:00', 'Z'),
-            expires=(now + timedelta(seconds=ttl_seconds)).isoformat().replace('+00:00', 'Z'),
-            nonce=secrets.token_hex(16),
+            expires=expires.isoformat().replace('+00:00', 'Z'),
+            nonce=os.urandom(16).hex(),  # Same CSPRNG that backs secrets.token_hex
             tier=tier,
             content=content,
             authorizations=authorizations or []
         )
+        message._expires_epoch = expires.timestamp()
+        message._expires_source = message.expires
         
         return self.sign(message)
 
@@ -256,28 +472,39 @@ class MessageVerifier:
             device_id: This device's ID (messages for other devices rejected)
         """
         self.device_id = device_id
+        self._accepted_device_ids = frozenset((device_id, "*"))  # "*" = broadcast
         self._seen_nonces: set = set()  # For replay detection
         self._max_nonces = 10000  # Limit memory usage
+        self._nonce_order: deque = deque()  # Seen nonces, oldest first
+        # Positive signature results, keyed by digest of signature + payload
+        self._verified_signatures: OrderedDict = OrderedDict()
+        self._max_verified_signatures = 4096
+        self._cache_lock = threading.Lock()  # verify_batch may check from worker threads
         
-        if not CRYPTO_AVAILABLE:
+        if not _load_crypto():
             logger.warning("Crypto not available - using development stub verification")
             self._public_key = None
+            self._nacl_key = None
             return
         
         self._public_key = Ed25519PublicKey.from_public_bytes(public_key)
+        self._nacl_key = NaclVerifyKey(public_key) if NACL_AVAILABLE else None
     
-    def verify(self, message: SignedMessage) -> bool:
+    def verify(self, message: SignedMessage, now_ns: Optional[int] = None) -> bool:
         """
         Verify a signed message.
         
-        Checks:
-        1. Signature is valid
+        Checks, cheapest first:
+        1. Signature is present and well-formed
         2. Message is for this device
-        3. Message has not expired
-        4. Message has not been seen before (replay protection)
+        3. Message has not been seen before (replay protection)
+        4. Message has not expired
+        5. Signature is valid
         
         Args:
             message: Message to verify
+            now_ns: Current time as time.time_ns() for the expiry check
+                    (None = read the clock)
             
         Returns:
             True if all checks pass
@@ -288,23 +515,132 @@ class MessageVerifier:
             ReplayDetectedError: Nonce has been seen before
             ValueError: Message is for different device
         """
-        # Check device ID
-        if message.device_id != self.device_id and message.device_id != "*":
-            raise ValueError(f"Message for device {message.device_id}, not {self.device_id}")
+        # Cheapest checks first, so bogus traffic never reaches the curve math
+        self._check_has_signature(message)
+        self._check_device_binding(message)
+        self._check_replay(message)
+        self._check_expiry(message, now_ns)
+        self._verify_signature(message)
         
-        # Check expiration
-        if message.is_expired():
-            raise MessageExpiredError(f"Message {message.message_id} expired at {message.expires}")
+        # Record nonce (after all checks pass)
+        self._record_nonce(message.nonce)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Verified message %s (tier: %s)", message.message_id, message.tier)
+        return True
+    
+    def verify_batch(
+        self,
+        messages: List[SignedMessage],
+        now_ns: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Optional[Exception]]:
+        """
+        Verify a batch of signed messages.
+        
+        The cheap checks (signature shape, device binding, replay, expiry)
+        run over the whole batch first, so no curve operations are spent on
+        messages that would be rejected anyway. Signatures are then checked
+        for the survivors in order. A nonce repeated inside the batch is
+        rejected once an earlier message carrying it has verified, exactly as
+        by successive verify() calls; accepted nonces are recorded together
+        at the end.
+        
+        With max_workers, the signature checks are spread over a thread pool.
+        The Ed25519 work happens in cryptography's native backend, so this
+        only helps when that backend runs it without holding the GIL; the
+        pool is created per call, so it pays off for large batches only.
+        
+        Args:
+            messages: Messages to verify
+            now_ns: Current time as time.time_ns() for the expiry checks
+                    (None = read the clock once for the whole batch)
+            max_workers: Threads for signature checks (None = check inline)
+            
+        Returns:
+            One entry per message: None if it verified, otherwise the
+            exception verify() would have raised for it
+        """
+        if now_ns is None:
+            now_ns = time.time_ns()
+        results: List[Optional[Exception]] = [None] * len(messages)
+        pending = []
+        
+        for i, message in enumerate(messages):
+            try:
+                self._check_has_signature(message)
+                self._check_device_binding(message)
+                self._check_replay(message)
+                self._check_expiry(message, now_ns)
+            except (SignatureError, MessageExpiredError, ReplayDetectedError, ValueError) as e:
+                results[i] = e
+            else:
+                pending.append(i)
+        
+        signature_errors: Optional[List[Optional[SignatureError]]] = None
+        if max_workers and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                signature_errors = list(pool.map(
+                    self._signature_error, [messages[i] for i in pending]
+                ))
+        
+        log_verified = logger.isEnabledFor(logging.INFO)
+        accepted_nonces: Dict[str, None] = {}  # Insertion-ordered set
+        for n, i in enumerate(pending):
+            message = messages[i]
+            try:
+                # Re-check: an earlier message in this batch may carry the same nonce
+                if message.nonce in accepted_nonces:
+                    raise ReplayDetectedError(
+                        f"Nonce {message.nonce} already seen - replay attack?"
+                    )
+                if signature_errors is None:
+                    self._verify_signature(message)
+                elif signature_errors[n] is not None:
+                    raise signature_errors[n]
+            except (SignatureError, ReplayDetectedError) as e:
+                results[i] = e
+                continue
+            accepted_nonces[message.nonce] = None
+            if log_verified:
+                logger.info("Verified message %s (tier: %s)", message.message_id, message.tier)
         
-        # Check replay
+        self._record_nonces(accepted_nonces)
+        return results
+    
+    def _check_device_binding(self, message: SignedMessage) -> None:
+        if message.device_id not in self._accepted_device_ids:
+            raise ValueError(f"Message for device {message.device_id}, not {self.device_id}")
+    
+    def _check_expiry(self, message: SignedMessage, now_ns: Optional[int] = None) -> None:
+        if message.is_expired(now_ns):
+            raise MessageExpiredError(f"Message {message.message_id} expired at {message.expires}")
+    
+    def _check_replay(self, message: SignedMessage) -> None:
         if message.nonce in self._seen_nonces:
             raise ReplayDetectedError(f"Nonce {message.nonce} already seen - replay attack?")
-        
-        # Verify signature
+    
+    def _check_has_signature(self, message: SignedMessage) -> None:
         if message.signature is None:
             raise SignatureError("Message has no signature")
-        
+        # Ed25519 signatures are always 64 bytes (128 hex characters)
+        if self._public_key is not None and len(message.signature) != _SIGNATURE_HEX_LENGTH:
+            raise SignatureError(
+                f"Malformed signature: expected {_SIGNATURE_HEX_LENGTH} hex characters"
+            )
+    
+    def _signature_error(self, message: SignedMessage) -> Optional[SignatureError]:
+        try:
+            self._verify_signature(message)
+        except SignatureError as e:
+            return e
+        return None
+    
+    def _verify_signature(self, message: SignedMessage) -> None:
+        """Check the signature over the message payload (raises SignatureError)."""
         payload = message.payload_for_signing()
+        if message.merkle_proof is not None:
+            payload = self._merkle_signed_root(message, payload)
         
         if not CRYPTO_AVAILABLE or self._public_key is None:
             # Development stub verification
@@ -312,28 +648,86 @@ class MessageVerifier:
                 expected = f"DEV:{hashlib.sha256(payload).hexdigest()}"
                 if message.signature != expected:
                     raise SignatureError("Invalid development stub signature")
-                logger.warning(f"Accepted development stub signature for {message.message_id}")
+                logger.warning("Accepted development stub signature for %s", message.message_id)
             else:
                 raise SignatureError("Production signature but crypto not available")
         else:
             try:
                 signature_bytes = bytes.fromhex(message.signature)
-                self._public_key.verify(signature_bytes, payload)
-            except InvalidSignature:
-                raise SignatureError(f"Invalid signature for message {message.message_id}")
             except ValueError as e:
                 raise SignatureError(f"Malformed signature: {e}")
+            
+            # The key covers the full payload, so altered content never hits
+            cache_key = hashlib.blake2b(signature_bytes + payload, digest_size=16).digest()
+            with self._cache_lock:
+                if cache_key in self._verified_signatures:
+                    self._verified_signatures.move_to_end(cache_key)
+                    return
+            
+            if self._nacl_key is not None:
+                try:
+                    self._nacl_key.verify(payload, signature_bytes)
+                except NaclBadSignatureError:
+                    raise SignatureError(f"Invalid signature for message {message.message_id}")
+                except (ValueError, TypeError) as e:
+                    raise SignatureError(f"Malformed signature: {e}")
+            else:
+                try:
+                    self._public_key.verify(signature_bytes, payload)
+                except InvalidSignature:
+                    raise SignatureError(f"Invalid signature for message {message.message_id}")
+                except ValueError as e:
+                    raise SignatureError(f"Malformed signature: {e}")
+            
+            with self._cache_lock:
+                self._verified_signatures[cache_key] = True
+                if len(self._verified_signatures) > self._max_verified_signatures:
+                    self._verified_signatures.popitem(last=False)
+    
+    @staticmethod
+    def _merkle_signed_root(message: SignedMessage, payload: bytes) -> bytes:
+        """Walk a batch message's inclusion proof up to the signed root."""
+        index = message.merkle_index
+        proof = message.merkle_proof
+        # Both arrive off the wire; check their types before len()/fromhex()
+        if not isinstance(proof, (list, tuple)) or not all(isinstance(h, str) for h in proof):
+            raise SignatureError(f"Malformed Merkle proof for message {message.message_id}")
+        if type(index) is not int or index < 0 or index >> len(proof):
+            raise SignatureError(f"Malformed Merkle index for message {message.message_id}")
         
-        # Record nonce (after all checks pass)
-        self._seen_nonces.add(message.nonce)
-        if len(self._seen_nonces) > self._max_nonces:
-            # Remove oldest half (simple LRU approximation)
-            to_remove = list(self._seen_nonces)[:self._max_nonces // 2]
-            for nonce in to_remove:
-                self._seen_nonces.discard(nonce)
-        
-        logger.info(f"Verified message {message.message_id} (tier: {message.tier})")
-        return True
+        node = _merkle_leaf(payload)
+        for sibling_hex in proof:
+            try:
+                sibling = bytes.fromhex(sibling_hex)
+            except ValueError as e:
+                raise SignatureError(f"Malformed Merkle proof: {e}")
+            if len(sibling) != _MERKLE_HASH_SIZE:
+                raise SignatureError("Malformed Merkle proof: bad hash length")
+            node = _merkle_parent(sibling, node) if index & 1 else _merkle_parent(node, sibling)
+            index >>= 1
+        
+        return _MERKLE_ROOT_PREFIX + node
+    
+    def clear_signature_cache(self) -> None:
+        """Forget cached signature results (call on key rotation)."""
+        with self._cache_lock:
+            self._verified_signatures.clear()
+    
+    def _record_nonce(self, nonce: str) -> None:
+        if nonce in self._seen_nonces:
+            return
+        self._seen_nonces.add(nonce)
+        self._nonce_order.append(nonce)
+        # Forget the oldest nonce once full (expiry covers anything older)
+        while len(self._nonce_order) > self._max_nonces:
+            self._seen_nonces.discard(self._nonce_order.popleft())
+    
+    def _record_nonces(self, nonces: Dict[str, None]) -> None:
+        """Record a batch's accepted nonces, none of which were seen before."""
+        self._seen_nonces.update(nonces)
+        self._nonce_order.extend(nonces)
+        while len(self._nonce_order) > self._max_nonces:
+            self._seen_nonces.discard(self._nonce_order.popleft())
     
     def verify_safe(self, message: SignedMessage) -> tuple[bool, Optional[str]]:
         """
@@ -347,3 +741,19 @@ class MessageVerifier:
             return True, None
         except (SignatureError, MessageExpiredError, ReplayDetectedError, ValueError) as e:
             return False, str(e)
+    
+    def verify_batch_safe(
+        self,
+        messages: List[SignedMessage],
+        max_workers: Optional[int] = None
+    ) -> List[tuple[bool, Optional[str]]]:
+        """
+        Verify a batch without raising exceptions (see verify_batch).
+        
+        Returns:
+            One (success, error_message) tuple per message
+        """
+        return [
+            (True, None) if error is None else (False, str(error))
+            for error in self.verify_batch(messages, max_workers=max_workers)
+        ]
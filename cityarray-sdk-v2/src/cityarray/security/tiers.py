@@ -14,7 +14,7 @@ Tiers:
 import logging
 from enum import Enum
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, FrozenSet
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -32,49 +32,58 @@ class AlertTier(Enum):
     @property
     def requires_human(self) -> bool:
         """Whether this tier requires human authorization."""
-        return self in (AlertTier.WARNING, AlertTier.EMERGENCY)
+        return self in _HUMAN_TIERS
     
     @property
     def requires_multiparty(self) -> bool:
         """Whether this tier requires multi-party authorization."""
-        return self == AlertTier.EMERGENCY
+        return self is AlertTier.EMERGENCY
     
     @property
     def min_authorizations(self) -> int:
         """Minimum number of authorizations required."""
-        if self == AlertTier.EMERGENCY:
-            return 2  # 2 of 3
-        elif self == AlertTier.WARNING:
-            return 1
-        else:
-            return 0  # Autonomous
+        return _TIER_MIN_AUTHORIZATIONS[self]
     
     @property
     def max_latency_seconds(self) -> int:
         """Maximum acceptable latency for this tier."""
-        latencies = {
-            AlertTier.INFORMATIONAL: 1,
-            AlertTier.ADVISORY: 2,
-            AlertTier.WARNING: 60,
-            AlertTier.EMERGENCY: 120,
-            AlertTier.IPAWS: 5,
-        }
-        return latencies.get(self, 60)
+        return _TIER_MAX_LATENCY[self]
     
     @property
     def ttl_seconds(self) -> int:
         """Default time-to-live for messages of this tier."""
-        ttls = {
-            AlertTier.INFORMATIONAL: 300,   # 5 minutes
-            AlertTier.ADVISORY: 600,        # 10 minutes
-            AlertTier.WARNING: 900,         # 15 minutes
-            AlertTier.EMERGENCY: 1800,      # 30 minutes
-            AlertTier.IPAWS: 3600,          # 1 hour (defer to IPAWS expiry)
-        }
-        return ttls.get(self, 300)
+        return _TIER_TTL[self]
 
 
-@dataclass
+# Per-tier requirements, built once rather than on every property access
+_HUMAN_TIERS = frozenset((AlertTier.WARNING, AlertTier.EMERGENCY))
+
+_TIER_MIN_AUTHORIZATIONS = {
+    AlertTier.INFORMATIONAL: 0,     # Autonomous
+    AlertTier.ADVISORY: 0,          # Autonomous
+    AlertTier.WARNING: 1,
+    AlertTier.EMERGENCY: 2,         # 2 of 3
+    AlertTier.IPAWS: 0,             # Already authorized upstream
+}
+
+_TIER_MAX_LATENCY = {
+    AlertTier.INFORMATIONAL: 1,
+    AlertTier.ADVISORY: 2,
+    AlertTier.WARNING: 60,
+    AlertTier.EMERGENCY: 120,
+    AlertTier.IPAWS: 5,
+}
+
+_TIER_TTL = {
+    AlertTier.INFORMATIONAL: 300,   # 5 minutes
+    AlertTier.ADVISORY: 600,        # 10 minutes
+    AlertTier.WARNING: 900,         # 15 minutes
+    AlertTier.EMERGENCY: 1800,      # 30 minutes
+    AlertTier.IPAWS: 3600,          # 1 hour (defer to IPAWS expiry)
+}
+
+
+@dataclass(slots=True)
 class TierAuthorization:
     """
     Authorization state for a pending alert.
@@ -111,7 +120,8 @@ class TierAuthorization:
         Returns:
             True if this authorization was accepted (not duplicate)
         """
-        # Check for duplicate
+        # Check for duplicate (scanned each time: there are only a few
+        # entries, and callers may edit authorizations directly)
         for auth in self.authorizations:
             if auth["operator_id"] == operator_id:
                 logger.warning(f"Duplicate authorization from {operator_id}")
@@ -140,25 +150,61 @@ class TierAuthorization:
         return max(0, self.required_count - len(self.authorizations))
 
 
-# Pre-approved message templates for autonomous tiers
-AUTONOMOUS_TEMPLATES = {
-    AlertTier.INFORMATIONAL: [
+# Pre-approved message templates for autonomous tiers (each template
+# belongs to one tier)
+AUTONOMOUS_TEMPLATES: Dict[AlertTier, FrozenSet[str]] = {
+    AlertTier.INFORMATIONAL: frozenset({
         "crowd-count",
         "weather-current",
         "time-display",
         "event-info",
         "wayfinding",
-    ],
-    AlertTier.ADVISORY: [
+    }),
+    AlertTier.ADVISORY: frozenset({
         "area-congested",
         "weather-advisory",
         "event-starting",
         "event-ending",
         "alternate-route",
-    ],
+    }),
+}
+
+# Reverse lookup: template ID -> the autonomous tier that pre-approves it
+_AUTONOMOUS_TEMPLATE_TO_TIER: Dict[str, AlertTier] = {
+    template_id: tier
+    for tier, templates in AUTONOMOUS_TEMPLATES.items()
+    for template_id in templates
 }
 
 
+# Detection type -> ((min confidence, tier), ...) checked in order, and the
+# tier used when no threshold is met
+_HIGH_SEVERITY_RULE = (
+    ((0.9, AlertTier.EMERGENCY), (0.7, AlertTier.WARNING)),
+    AlertTier.ADVISORY,
+)
+_MEDIUM_SEVERITY_RULE = (((0.85, AlertTier.WARNING),), AlertTier.ADVISORY)
+_LOW_SEVERITY_RULE = ((), AlertTier.INFORMATIONAL)
+
+_DETECTION_RULES = {
+    # High-severity detections
+    "fire": _HIGH_SEVERITY_RULE,
+    "active_shooter": _HIGH_SEVERITY_RULE,
+    "explosion": _HIGH_SEVERITY_RULE,
+    # Medium-severity detections
+    "smoke": _MEDIUM_SEVERITY_RULE,
+    "fight": _MEDIUM_SEVERITY_RULE,
+    "medical_emergency": _MEDIUM_SEVERITY_RULE,
+    # Low-severity detections
+    "crowd": _LOW_SEVERITY_RULE,
+    "congestion": _LOW_SEVERITY_RULE,
+    "weather": _LOW_SEVERITY_RULE,
+}
+
+# Default to advisory for unknown types
+_DEFAULT_DETECTION_RULE = ((), AlertTier.ADVISORY)
+
+
 def get_tier_for_detection(detection_type: str, confidence: float) -> AlertTier:
     """
     Determine appropriate tier for a detection event.
@@ -170,28 +216,11 @@ def get_tier_for_detection(detection_type: str, confidence: float) -> AlertTier:
     Returns:
         Appropriate alert tier
     """
-    # High-severity detections
-    if detection_type in ("fire", "active_shooter", "explosion"):
-        if confidence >= 0.9:
-            return AlertTier.EMERGENCY
-        elif confidence >= 0.7:
-            return AlertTier.WARNING
-        else:
-            return AlertTier.ADVISORY
-    
-    # Medium-severity detections
-    if detection_type in ("smoke", "fight", "medical_emergency"):
-        if confidence >= 0.85:
-            return AlertTier.WARNING
-        else:
-            return AlertTier.ADVISORY
-    
-    # Low-severity detections
-    if detection_type in ("crowd", "congestion", "weather"):
-        return AlertTier.INFORMATIONAL
-    
-    # Default to advisory for unknown types
-    return AlertTier.ADVISORY
+    steps, fallback = _DETECTION_RULES.get(detection_type, _DEFAULT_DETECTION_RULE)
+    for threshold, tier in steps:
+        if confidence >= threshold:
+            return tier
+    return fallback
 
 
 def is_template_autonomous(tier: AlertTier, template_id: str) -> bool:
@@ -205,11 +234,27 @@ def is_template_autonomous(tier: AlertTier, template_id: str) -> bool:
     Returns:
         True if template is pre-approved for autonomous display
     """
-    if tier.requires_human:
+    # One str-keyed lookup in the reverse index; the tier is only inspected
+    # for templates that are pre-approved somewhere. template_id comes from
+    # signed content and may be any JSON value (lists are unhashable).
+    if not isinstance(template_id, str):
         return False
+    return _AUTONOMOUS_TEMPLATE_TO_TIER.get(template_id) is tier and not tier.requires_human
+
+
+def get_autonomous_tier(template_id: str) -> Optional[AlertTier]:
+    """
+    Find the autonomous tier a template is pre-approved for.
     
-    allowed = AUTONOMOUS_TEMPLATES.get(tier, [])
-    return template_id in allowed
+    Args:
+        template_id: Template identifier
+        
+    Returns:
+        The tier, or None if the template is not pre-approved for any
+    """
+    if not isinstance(template_id, str):
+        return None
+    return _AUTONOMOUS_TEMPLATE_TO_TIER.get(template_id)
 
 
 def requires_authorization(tier: AlertTier):
@@ -257,7 +302,7 @@ class TierValidator:
         self,
         tier: AlertTier,
         template_id: str,
-        authorizations: List[Dict[str, Any]]
+        authorizations: Sequence[Any]
     ) -> tuple[bool, Optional[str]]:
         """
         Validate a message against tier requirements.
@@ -265,7 +310,8 @@ class TierValidator:
         Args:
             tier: Alert tier
             template_id: Message template ID
-            authorizations: List of authorization records
+            authorizations: Authorization records, either dicts or objects
+                            with an operator_id attribute (e.g. signing.Authorization)
             
         Returns:
             Tuple of (is_valid, error_message)
@@ -281,17 +327,27 @@ class TierValidator:
         if len(authorizations) < tier.min_authorizations:
             return False, f"Need {tier.min_authorizations} authorizations, got {len(authorizations)}"
         
+        # Single-operator tiers without an allow-list need nothing more
+        if not self.allowed_operators and not tier.requires_multiparty:
+            return True, None
+        
+        operator_ids = [_operator_id(a) for a in authorizations]
+        unique_ids = set(operator_ids)
+        
         # Check operator validity
-        if self.allowed_operators:
-            for auth in authorizations:
-                op_id = auth.get("operator_id")
-                if op_id not in self.allowed_operators:
-                    return False, f"Operator '{op_id}' not authorized"
+        if self.allowed_operators and not self.allowed_operators.issuperset(unique_ids):
+            op_id = next(op for op in operator_ids if op not in self.allowed_operators)
+            return False, f"Operator '{op_id}' not authorized"
         
         # Check for duplicate operators in multi-party
-        if tier.requires_multiparty:
-            operator_ids = [a.get("operator_id") for a in authorizations]
-            if len(operator_ids) != len(set(operator_ids)):
-                return False, "Multi-party authorization requires different operators"
+        if tier.requires_multiparty and len(unique_ids) != len(operator_ids):
+            return False, "Multi-party authorization requires different operators"
         
         return True, None
+
+
+def _operator_id(authorization: Any) -> Optional[str]:
+    """Operator ID from an authorization dict or object."""
+    if isinstance(authorization, dict):
+        return authorization.get("operator_id")
+    return getattr(authorization, "operator_id", None)
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for CITYARRAY tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cityarray.security.signing import MessageSigner
+
+
+@pytest.fixture(scope="session")
+def signer():
+    """
+    One signing key for the whole session.
+    
+    MessageSigner keeps no per-message state, so tests can share it; each
+    test builds its own MessageVerifier, which does (replay nonces).
+    """
+    return MessageSigner()
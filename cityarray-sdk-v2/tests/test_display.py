@@ -0,0 +1,275 @@
+"""
+Tests for CITYARRAY Secure Display Engine
+"""
+
+import random
+
+import pytest
+
+from cityarray.security.signing import MessageVerifier, SignedMessage
+from cityarray.security.audit import AuditLogger
+from cityarray.display import SecureDisplayEngine, SecureDisplayBackend, RejectCode
+from cityarray.display.secure_engine import wrap_text
+
+
+class RecordingBackend(SecureDisplayBackend):
+    """Backend that keeps rendered content instead of showing it."""
+
+    def __init__(self):
+        self.rendered = []
+
+    def render(self, content):
+        self.rendered.append(content)
+        return True
+
+    def clear(self):
+        return True
+
+    def get_capabilities(self):
+        return {"backend": "recording"}
+
+
+def make_engine(signer, log_path):
+    """Engine for device "test" with its own verifier, backend and audit log."""
+    return SecureDisplayEngine(
+        device_id="test",
+        backend=RecordingBackend(),
+        verifier=MessageVerifier(signer.public_key, device_id="test"),
+        audit_logger=AuditLogger(device_id="test", log_path=log_path),
+    )
+
+
+def make_message(signer, text="Hello", **kwargs):
+    """Signed informational message for device "test"."""
+    return signer.create_signed_message(
+        device_id=kwargs.pop("device_id", "test"),
+        tier="informational",
+        content={"template_id": "crowd-count", "text": {"en": text}},
+        **kwargs
+    )
+
+
+def with_signature(message, signature):
+    """Copy of a message carrying a different signature."""
+    copy = SignedMessage.from_dict(message.to_dict())
+    copy.signature = signature
+    return copy
+
+
+def audit_trail(engine):
+    """Audit entries as (event type, data), without timestamps and hashes."""
+    return [(e.event_type, e.data) for e in engine.audit.get_entries()]
+
+
+class TestDisplayBatch:
+    """Tests for SecureDisplayEngine.display_batch."""
+
+    def test_batch_matches_sequential_display(self, signer, tmp_path):
+        """Test that a batch gives the same results and audit trail as display()."""
+        first = make_message(signer, "First")
+        second = make_message(signer, "Second")
+        messages = [
+            first,
+            with_signature(second, "00" * 64),   # Forged copy, rejected mid-batch
+            second,                              # Same nonce; the forgery must not block it
+            make_message(signer, "Late", ttl_seconds=-10),
+            first,                               # Replay within the batch
+            make_message(signer, "Elsewhere", device_id="other"),
+            make_message(signer, "Last"),
+        ]
+
+        sequential = make_engine(signer, tmp_path / "sequential.log")
+        expected = [sequential.display(m) for m in messages]
+
+        batched = make_engine(signer, tmp_path / "batched.log")
+        results = batched.display_batch(messages)
+
+        assert [r.success for r in expected] == [True, False, True, False, False, False, True]
+        assert len(results) == len(expected)
+        for result, want in zip(results, expected):
+            assert result.success == want.success
+            assert result.message_id == want.message_id
+            assert result.error == want.error
+            assert result.code == want.code
+            assert (result.displayed_at is None) == (want.displayed_at is None)
+
+        assert batched.backend.rendered == sequential.backend.rendered
+        assert audit_trail(batched) == audit_trail(sequential)
+        assert batched.current_message is sequential.current_message
+
+    def test_batch_with_worker_threads(self, signer, tmp_path):
+        """Test that threaded signature checks keep per-message results in order."""
+        messages = [make_message(signer, f"Message {i}") for i in range(6)]
+        messages[3] = with_signature(messages[3], "00" * 64)
+
+        engine = make_engine(signer, tmp_path / "audit.log")
+        results = engine.display_batch(messages, max_workers=3)
+
+        assert [r.success for r in results] == [True, True, True, False, True, True]
+        assert [r.message_id for r in results] == [m.message_id for m in messages]
+        assert len(engine.backend.rendered) == 5
+
+
+class TestRejectCodes:
+    """Tests for the machine-readable reason on rejected messages."""
+
+    def test_accepted_message_has_no_code(self, signer, tmp_path):
+        """Test that a displayed message carries no reject code."""
+        engine = make_engine(signer, tmp_path / "audit.log")
+        result = engine.display(make_message(signer))
+        assert result.success is True
+        assert result.code is None
+
+    @pytest.mark.parametrize("case, code", [
+        ("unsigned", RejectCode.SIGNATURE_INVALID),
+        ("bad_signature", RejectCode.SIGNATURE_INVALID),
+        ("unknown_device", RejectCode.INVALID_MESSAGE),
+        ("expired", RejectCode.EXPIRED),
+        ("replay", RejectCode.REPLAY),
+        ("unknown_tier", RejectCode.UNKNOWN_TIER),
+    ])
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_rejection_codes(self, signer, tmp_path, case, code, batch):
+        """Test the reject code for each verification failure."""
+        engine = make_engine(signer, tmp_path / "audit.log")
+        message = make_message(signer)
+        if case == "unsigned":
+            message = with_signature(message, None)
+        elif case == "bad_signature":
+            message.content["text"]["en"] = "Tampered"
+        elif case == "unknown_device":
+            message = make_message(signer, device_id="other")
+        elif case == "expired":
+            message = make_message(signer, ttl_seconds=-10)
+        elif case == "replay":
+            assert engine.display(message).success is True
+        elif case == "unknown_tier":
+            message.tier = "bogus"
+            signer.sign(message)
+
+        if batch:
+            result = engine.display_batch([message])[0]
+        else:
+            result = engine.display(message)
+        assert result.success is False
+        assert result.code is code
+
+    @pytest.mark.parametrize("proof, index", [
+        (5, 0),
+        ("ab" * 32, 0),
+        ({"sibling": "ab" * 32}, 0),
+        ([5], 0),
+        ([None], 1),
+        ([["ab" * 32]], 0),
+        (["ab" * 32], True),
+        (["ab" * 32], "0"),
+    ])
+    @pytest.mark.parametrize("batch", [False, True])
+    def test_malformed_merkle_proof_is_rejected(self, signer, tmp_path, proof, index, batch):
+        """Test that a junk Merkle proof off the wire is rejected, not raised."""
+        engine = make_engine(signer, tmp_path / "audit.log")
+        messages = [make_message(signer, f"Message {i}") for i in range(2)]
+        signer.sign_batch(messages)
+        data = messages[0].to_dict()
+        data["merkle_proof"] = proof
+        data["merkle_index"] = index
+        message = SignedMessage.from_dict(data)
+
+        if batch:
+            results = engine.display_batch([message, messages[1]], max_workers=2)
+            assert results[1].success is True
+            result = results[0]
+        else:
+            result = engine.display(message)
+        assert result.success is False
+        assert result.code is RejectCode.SIGNATURE_INVALID
+
+    def test_tier_validation_code(self, signer, tmp_path):
+        """Test that a message lacking required authorizations is TIER_VALIDATION."""
+        engine = make_engine(signer, tmp_path / "audit.log")
+        message = signer.create_signed_message(
+            device_id="test",
+            tier="emergency",
+            content={"template_id": "evacuate", "text": {"en": "Leave now"}},
+        )
+        result = engine.display(message)
+        assert result.success is False
+        assert result.code is RejectCode.TIER_VALIDATION
+
+    def test_non_string_template_id(self, signer, tmp_path):
+        """Test that a list template_id is rejected by tier validation, not raised."""
+        engine = make_engine(signer, tmp_path / "audit.log")
+        message = signer.create_signed_message(
+            device_id="test",
+            tier="informational",
+            content={"template_id": ["crowd-count"], "text": {"en": "Hello"}},
+        )
+        result = engine.display(message)
+        assert result.success is False
+        assert result.code is RejectCode.TIER_VALIDATION
+
+    def test_render_failed_code(self, signer, tmp_path):
+        """Test that a backend failure is RENDER_FAILED."""
+        engine = make_engine(signer, tmp_path / "audit.log")
+        engine.backend.render = lambda content: False
+        result = engine.display(make_message(signer))
+        assert result.success is False
+        assert result.code is RejectCode.RENDER_FAILED
+
+
+def reference_wrap(text, width, max_lines=None):
+    """The greedy wrap loop the display backends used before wrap_text."""
+    lines = []
+    current_line = ""
+    for word in text.split():
+        if len(current_line) + len(word) + 1 <= width:
+            current_line += (" " if current_line else "") + word
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    return lines if max_lines is None else lines[:max_lines]
+
+
+class TestWrapText:
+    """Tests for the shared greedy word wrap."""
+
+    @pytest.mark.parametrize("text, width, expected", [
+        ("", 10, []),
+        ("   \t\n ", 10, []),
+        ("one two three", 20, ["one two three"]),
+        ("aaaa bbbb cccc", 9, ["aaaa bbbb", "cccc"]),           # Exact-width line
+        ("aaaa bbbbb", 9, ["aaaa", "bbbbb"]),                   # One over
+        ("abcdefghij", 10, ["abcdefghij"]),                     # Word exactly width
+        ("hi abcdefghijklmno yo", 5, ["hi", "abcdefghijklmno", "yo"]),  # Long word
+        ("  lots   of    spaces  ", 8, ["lots of", "spaces"]),
+        ("a\tb\nc", 3, ["a b", "c"]),
+    ])
+    def test_wrap(self, text, width, expected):
+        """Test wrapping against known output and the old loop."""
+        assert wrap_text(text, width) == expected
+        assert reference_wrap(text, width) == expected
+
+    @pytest.mark.parametrize("max_lines", [0, 1, 2, 3, 10])
+    def test_max_lines(self, max_lines):
+        """Test that max_lines keeps the first lines of the full wrap."""
+        text = "the quick brown fox jumps over the lazy dog"
+        assert wrap_text(text, 10, max_lines=max_lines) == wrap_text(text, 10)[:max_lines]
+
+    def test_matches_old_loop(self):
+        """Test equivalence with the old loop on random word soups."""
+        rng = random.Random(7)
+        for _ in range(500):
+            words = [
+                "x" * rng.randint(1, 14) for _ in range(rng.randint(0, 12))
+            ]
+            text = "".join(w + " " * rng.randint(1, 3) for w in words)
+            width = rng.randint(1, 16)
+            max_lines = rng.choice([None, 1, 2, 3])
+            assert wrap_text(text, width, max_lines) == reference_wrap(text, width, max_lines)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,187 @@
+"""
+Tests for CITYARRAY Virtual LED Simulator
+"""
+
+import os
+import random
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from cityarray.display.led_simulator import FONT_5X7, LEDSimulator, SimulatorConfig
+
+
+@pytest.fixture
+def make_sim():
+    """Build initialized simulators, shutting pygame down afterwards."""
+    sims = []
+
+    def make(**config):
+        sim = LEDSimulator(SimulatorConfig(**config))
+        sim.init()
+        sims.append(sim)
+        return sim
+
+    yield make
+    for sim in sims:
+        sim.quit()
+
+
+# Reference: the original per-pixel drawing and rendering code
+
+def reference_set_pixel(pixels, x, y, color):
+    if 0 <= x < pixels.shape[1] and 0 <= y < pixels.shape[0]:
+        pixels[y, x] = color
+
+
+def reference_draw_char(pixels, char, x, y, color):
+    char = char.upper()
+    if char not in FONT_5X7:
+        char = '?'
+    for col, byte in enumerate(FONT_5X7[char]):
+        for row in range(7):
+            if byte & (1 << row):
+                reference_set_pixel(pixels, x + col, y + row, color)
+    return 6
+
+
+def reference_draw_text(pixels, text, x, y, color, center=False):
+    if center:
+        x = x - (len(text) * 6 - 1) // 2
+    for char in text:
+        x += reference_draw_char(pixels, char, x, y, color)
+
+
+def reference_render(sim):
+    """The window as the original render() drew it, for sim's pixels."""
+    cfg = sim.config
+    screen = pygame.Surface(sim.screen.get_size(), 0, sim.screen)
+    screen.fill(cfg.background)
+    for y in range(cfg.height):
+        for x in range(cfg.width):
+            color = tuple(int(c) for c in sim.pixels[y, x])
+            screen_x = x * (cfg.pixel_size + cfg.pixel_gap) + cfg.pixel_gap
+            screen_y = y * (cfg.pixel_size + cfg.pixel_gap) + cfg.pixel_gap
+            if cfg.glow and color != (0, 0, 0):
+                glow_color = tuple(c // 4 for c in color)
+                glow_size = cfg.pixel_size + 4
+                pygame.draw.ellipse(
+                    screen, glow_color,
+                    pygame.Rect(screen_x - 2, screen_y - 2, glow_size, glow_size)
+                )
+            pygame.draw.ellipse(
+                screen, color, pygame.Rect(screen_x, screen_y, cfg.pixel_size, cfg.pixel_size)
+            )
+    return pygame.surfarray.array3d(screen)
+
+
+def full_redraw(sim):
+    """Window contents after redrawing every row from scratch."""
+    sim._prev_pixels = None
+    sim.render()
+    return pygame.surfarray.array3d(sim.screen)
+
+
+class TestRender:
+    """Tests for LEDSimulator.render."""
+
+    def test_direct_pixel_writes_are_rendered(self, make_sim):
+        """Test that writes straight into pixels show up on the next render."""
+        sim = make_sim()
+        sim.draw_text_centered("HI", (255, 0, 0))
+        sim.render()
+        before = pygame.surfarray.array3d(sim.screen)
+
+        sim.pixels[3, 4] = (0, 0, 255)
+        sim.pixels[30, 60:64] = (0, 255, 0)
+        sim.render()
+        after = pygame.surfarray.array3d(sim.screen)
+
+        assert not np.array_equal(after, before)
+        assert np.array_equal(after, full_redraw(sim))
+
+    @pytest.mark.parametrize("config", [
+        {},
+        {"glow": False},
+        {"pixel_gap": 0},
+        {"pixel_gap": 1},
+        {"pixel_gap": 3, "pixel_size": 5},
+        {"width": 20, "height": 9, "background": (0, 0, 0)},
+    ])
+    def test_matches_reference_renderer(self, make_sim, config):
+        """Test every incremental frame against the original full-frame renderer."""
+        sim = make_sim(**config)
+        width, height = sim.config.width, sim.config.height
+        rng = random.Random(3)
+        colors = [(255, 0, 0), (0, 255, 0), (255, 191, 0), (7, 130, 254), (255, 255, 255)]
+
+        for frame in range(40):
+            step = frame % 4
+            if step == 0:
+                # New message: full clear and text (mono fast path)
+                sim.clear()
+                sim.draw_text_centered("ALERT 42", rng.choice(colors))
+            elif step == 1:
+                # A few pixels in one or two rows (dirty band)
+                for _ in range(rng.randint(1, 3)):
+                    sim.set_pixel(rng.randrange(width), rng.choice([0, height - 1]),
+                                  rng.choice(colors))
+            elif step == 2:
+                # Mixed colors spread over the panel
+                sim.fill_rect(rng.randrange(width), rng.randrange(height), 4, 3,
+                              rng.choice(colors))
+                sim.draw_text("ok", rng.randrange(-4, width), rng.randrange(-3, height),
+                              rng.choice(colors))
+            # step 3: nothing changed
+
+            sim.render()
+            assert np.array_equal(pygame.surfarray.array3d(sim.screen), reference_render(sim)), \
+                f"frame {frame} differs"
+
+
+class TestGlyphs:
+    """Tests for character and text drawing against the original code."""
+
+    CHARS = [chr(code) for code in range(128)] + list("ßıéÅ€日")
+
+    def test_every_glyph_matches_reference(self, make_sim):
+        """Test draw_char for every ASCII code and some non-ASCII characters."""
+        sim = make_sim(width=12, height=10)
+        for char in self.CHARS:
+            for x, y in [(1, 1), (-2, -3), (9, 6)]:
+                expected = np.zeros_like(sim.pixels)
+                assert reference_draw_char(expected, char, x, y, (255, 191, 0)) == 6
+                sim.clear()
+                assert sim.draw_char(char, x, y, (255, 191, 0)) == 6
+                assert np.array_equal(sim.pixels, expected), repr(char)
+
+    def test_text_matches_reference(self, make_sim):
+        """Test draw_text and draw_text_centered, including clipping."""
+        sim = make_sim()
+        text = "".join(self.CHARS)
+        cases = [
+            (text[32:96], 0, 0, False),
+            (text[96:] + text[:32], -20, 27, False),
+            ("Evacuate: Zone B!", 32, 12, True),
+            ("x" * 20, 32, -4, True),
+            ("", 5, 5, False),
+        ]
+        for chunk, x, y, center in cases:
+            expected = np.zeros_like(sim.pixels)
+            reference_draw_text(expected, chunk, x, y, (0, 255, 0), center)
+            sim.clear()
+            sim.draw_text(chunk, x, y, (0, 255, 0), center=center)
+            assert np.array_equal(sim.pixels, expected), (chunk, x, y)
+
+        expected = np.zeros_like(sim.pixels)
+        reference_draw_text(expected, "WARNING", 32, (32 - 7) // 2 + 3, (255, 0, 0), True)
+        sim.clear()
+        sim.draw_text_centered("WARNING", (255, 0, 0), y_offset=3)
+        assert np.array_equal(sim.pixels, expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
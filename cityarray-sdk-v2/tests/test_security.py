@@ -2,31 +2,36 @@
 Tests for CITYARRAY Security Module
 """
 
-import pytest
-import sys
-from pathlib import Path
+import gc
+import enum
+import json
+import threading
+import uuid
+import weakref
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
 
 from cityarray.security.signing import (
-    MessageSigner, MessageVerifier, SignedMessage, Authorization,
+    MessageVerifier, SignedMessage, Authorization,
     SignatureError, MessageExpiredError, ReplayDetectedError
 )
-from cityarray.security.audit import AuditLogger, AuditEventType
+from cityarray.security import _canon
+from cityarray.security._canon import canonical
+from cityarray.security.audit import AuditLogger, AuditEventType, AuditEvent
 from cityarray.security.tiers import (
     AlertTier, TierAuthorization, get_tier_for_detection,
-    is_template_autonomous, TierValidator
+    is_template_autonomous, get_autonomous_tier, TierValidator
 )
+from cityarray.security.keys import SoftwareKeyStore
 
 
 class TestMessageSigning:
     """Tests for message signing and verification."""
     
-    def test_sign_and_verify(self):
+    def test_sign_and_verify(self, signer):
         """Test basic sign/verify workflow."""
-        signer = MessageSigner()
         verifier = MessageVerifier(signer.public_key, device_id="test-device")
         
         message = signer.create_signed_message(
@@ -39,9 +44,8 @@ class TestMessageSigning:
         assert message.signature is not None
         assert verifier.verify(message) is True
     
-    def test_reject_wrong_device(self):
+    def test_reject_wrong_device(self, signer):
         """Test that messages for other devices are rejected."""
-        signer = MessageSigner()
         verifier = MessageVerifier(signer.public_key, device_id="device-A")
         
         message = signer.create_signed_message(
@@ -53,9 +57,8 @@ class TestMessageSigning:
         with pytest.raises(ValueError, match="device-B"):
             verifier.verify(message)
     
-    def test_reject_expired(self):
+    def test_reject_expired(self, signer):
         """Test that expired messages are rejected."""
-        signer = MessageSigner()
         verifier = MessageVerifier(signer.public_key, device_id="test")
         
         # Create message that's already expired
@@ -69,9 +72,24 @@ class TestMessageSigning:
         with pytest.raises(MessageExpiredError):
             verifier.verify(message)
     
-    def test_reject_replay(self):
+    def test_expires_epoch_tracks_expires(self, signer):
+        """Test that the cached expiry follows the expires string."""
+        message = signer.create_signed_message(
+            device_id="test",
+            tier="informational",
+            content={"template_id": "test"}
+        )
+        parsed = datetime.fromisoformat(message.expires.replace('Z', '+00:00'))
+        assert message.expires_epoch == parsed.timestamp()
+        assert not message.is_expired()
+        
+        # Round trip parses the string; reassignment invalidates the cache
+        assert SignedMessage.from_json(message.to_json()).expires_epoch == parsed.timestamp()
+        message.expires = "2000-01-01T00:00:00Z"
+        assert message.is_expired()
+    
+    def test_reject_replay(self, signer):
         """Test that replayed messages are rejected."""
-        signer = MessageSigner()
         verifier = MessageVerifier(signer.public_key, device_id="test")
         
         message = signer.create_signed_message(
@@ -87,9 +105,8 @@ class TestMessageSigning:
         with pytest.raises(ReplayDetectedError):
             verifier.verify(message)
     
-    def test_reject_tampered(self):
+    def test_reject_tampered(self, signer):
         """Test that tampered messages are rejected."""
-        signer = MessageSigner()
         verifier = MessageVerifier(signer.public_key, device_id="test")
         
         message = signer.create_signed_message(
@@ -100,10 +117,178 @@ class TestMessageSigning:
         
         # Tamper with content
         message.content["template_id"] = "hacked"
+
+        with pytest.raises(SignatureError):
+            verifier.verify(message)
         
+        # Truncated signatures are rejected before anything else is checked
+        message.content["template_id"] = "test"
+        message.signature = message.signature[:-2]
+        message.device_id = "other"
+        with pytest.raises(SignatureError, match="Malformed"):
+            verifier.verify(message)
+
+    def test_verify_batch(self, signer):
+        """Test that batch verification isolates bad messages."""
+        verifier = MessageVerifier(signer.public_key, device_id="test")
+
+        good = signer.create_signed_message(
+            device_id="test", tier="informational", content={"template_id": "a"}
+        )
+        tampered = signer.create_signed_message(
+            device_id="test", tier="informational", content={"template_id": "b"}
+        )
+        tampered.content["template_id"] = "hacked"
+        expired = signer.create_signed_message(
+            device_id="test", tier="informational", content={"template_id": "c"},
+            ttl_seconds=-10
+        )
+
+        results = verifier.verify_batch([good, tampered, expired, good])
+
+        assert results[0] is None
+        assert isinstance(results[1], SignatureError)
+        assert isinstance(results[2], MessageExpiredError)
+        assert isinstance(results[3], ReplayDetectedError)
+        with pytest.raises(ReplayDetectedError):
+            verifier.verify(good)
+
+        fresh = MessageVerifier(signer.public_key, device_id="test")
+        safe = fresh.verify_batch_safe([good, expired])
+        assert safe[0] == (True, None)
+        assert safe[1][0] is False and "expired" in safe[1][1]
+
+    def test_nonce_eviction_is_oldest_first(self, signer):
+        """Test that the replay window forgets the oldest nonces first."""
+        verifier = MessageVerifier(signer.public_key, device_id="test")
+        verifier._max_nonces = 100
+        for i in range(150):
+            verifier._record_nonce(f"n{i}")
+
+        assert len(verifier._seen_nonces) == 100
+        assert "n49" not in verifier._seen_nonces
+        assert all(f"n{i}" in verifier._seen_nonces for i in range(50, 150))
+
+    def test_signature_cache_rejects_tampered(self, signer):
+        """Test that a cached signature does not cover altered content."""
+        verifier = MessageVerifier(signer.public_key, device_id="test")
+
+        message = signer.create_signed_message(
+            device_id="test", tier="informational", content={"template_id": "test"}
+        )
+        assert verifier.verify(message) is True
+        verified_payload = message.signed_payload
+
+        # Simulate the nonce having been evicted, then tamper
+        verifier._seen_nonces.discard(message.nonce)
+        message.content["template_id"] = "hacked"
+        assert message.signed_payload == verified_payload  # Cached, never used to verify
+
         with pytest.raises(SignatureError):
             verifier.verify(message)
 
+    def test_canonical_payload(self, signer):
+        """Test that the signed payload is the canonical JSON of all fields."""
+        message = signer.create_signed_message(
+            device_id="test",
+            tier="warning",
+            content={"template_id": "fire", "text": {"es": "¡Fuego!", "en": "FIRE"}},
+            authorizations=[Authorization(operator_id="op-1", timestamp="t")],
+        )
+
+        expected = json.dumps({
+            "message_id": message.message_id,
+            "device_id": message.device_id,
+            "timestamp": message.timestamp,
+            "expires": message.expires,
+            "nonce": message.nonce,
+            "tier": message.tier,
+            "content": message.content,
+            "authorizations": [a.to_dict() for a in message.authorizations],
+        }, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+        assert message.payload_for_signing() == expected
+        assert message.canonical_content in expected
+
+    def test_canonical_matches_json(self):
+        """Test that canonical() never changes the signed byte form."""
+        values = [
+            {"b": 1, "a": [None, True, "text"]},
+            {"text": "¡Fuego! 火灾 \u2028 \x7f"},
+            {"f": 1.5, "big": 1e16, "small": 1e-05, "nan": float("nan")},
+            {"n": 2 ** 70, "m": {2: "int key", 1: "int key"}},
+            {"ts": "2024-01-01T00:00:00.5Z", "none": None, "t": (1, [2.5, "x"])},
+        ]
+        for value in values:
+            assert canonical(value) == json.dumps(
+                value, sort_keys=True, separators=(',', ':')
+            ).encode('utf-8')
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_canonical_accepts_what_json_accepts(self, monkeypatch, use_orjson):
+        """Test that orjson being installed never changes which values encode."""
+        class Color(enum.Enum):
+            RED = "red"
+
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        class Name(str):
+            pass
+
+        @dataclass
+        class Point:
+            x: int
+
+        monkeypatch.setattr(_canon, "ORJSON_AVAILABLE", use_orjson and _canon.ORJSON_AVAILABLE)
+        values = [
+            {"x": Color.RED},
+            {"x": Level.HIGH},
+            {"x": uuid.UUID(int=1)},
+            {"x": Name("n"), Name("k"): 1},
+            {"x": Point(1)},
+            {"x": datetime(2024, 1, 1)},
+            {"x": {1, 2}},
+            {"x": b"bytes"},
+            {"x": [1, {"y": Color.RED}]},
+        ]
+        for value in values:
+            try:
+                expected = json.dumps(value, sort_keys=True, separators=(',', ':'))
+            except TypeError:
+                with pytest.raises(TypeError):
+                    canonical(value)
+            else:
+                assert canonical(value) == expected.encode('utf-8')
+
+    def test_sign_batch(self, signer):
+        """Test Merkle-batched signing verifies per message and catches tampering."""
+        verifier = MessageVerifier(signer.public_key, device_id="test")
+
+        messages = [
+            SignedMessage(
+                message_id=f"m{i}", device_id="test",
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                expires=(datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat(),
+                nonce=f"n{i}", tier="informational", content={"template_id": f"t{i}"}
+            )
+            for i in range(5)
+        ]
+        signer.sign_batch(messages)
+
+        assert len({m.signature for m in messages}) == 1
+        restored = SignedMessage.from_json(messages[4].to_json())
+        assert verifier.verify(restored) is True
+        assert verifier.verify(messages[0]) is True
+
+        messages[1].content["template_id"] = "hacked"
+        with pytest.raises(SignatureError):
+            verifier.verify(messages[1])
+
+        messages[2].merkle_index = 3
+        with pytest.raises(SignatureError):
+            verifier.verify(messages[2])
+
 
 class TestAlertTiers:
     """Tests for alert tier classification."""
@@ -141,6 +326,15 @@ class TestAlertTiers:
         assert is_template_autonomous(AlertTier.INFORMATIONAL, "crowd-count") is True
         assert is_template_autonomous(AlertTier.INFORMATIONAL, "custom-alert") is False
         assert is_template_autonomous(AlertTier.WARNING, "crowd-count") is False
+        
+        assert get_autonomous_tier("crowd-count") == AlertTier.INFORMATIONAL
+        assert get_autonomous_tier("event-ending") == AlertTier.ADVISORY
+        assert get_autonomous_tier("custom-alert") is None
+        
+        # template_id comes from signed JSON: non-strings are never approved
+        for template_id in (["crowd-count"], {"id": "crowd-count"}, None, 5):
+            assert is_template_autonomous(AlertTier.INFORMATIONAL, template_id) is False
+            assert get_autonomous_tier(template_id) is None
     
     def test_tier_authorization(self):
         """Test authorization workflow."""
@@ -161,6 +355,20 @@ class TestAlertTiers:
         auth.add_authorization("operator-2", "dashboard")
         assert auth.is_satisfied is True
         assert auth.remaining == 0
+        
+        # Duplicates are caught across the constructor and direct edits too
+        seeded = TierAuthorization(
+            tier=AlertTier.EMERGENCY, required_count=2,
+            authorizations=[{"operator_id": "operator-1"}]
+        )
+        assert seeded.add_authorization("operator-1") is False
+        seeded.authorizations.append({"operator_id": "operator-3"})
+        assert seeded.add_authorization("operator-3") is False
+        
+        # Including an entry replaced in place
+        seeded.authorizations[0] = {"operator_id": "operator-4"}
+        assert seeded.add_authorization("operator-4") is False
+        assert seeded.add_authorization("operator-1") is True
 
 
 class TestAuditLogging:
@@ -172,14 +380,17 @@ class TestAuditLogging:
         audit = AuditLogger(device_id="test", log_path=log_file)
         
         # Log some events
-        audit.log(AuditEventType.SYSTEM_BOOT, {"version": "1.0"})
-        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-1"})
-        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-2"})
+        logged = [
+            audit.log(AuditEventType.SYSTEM_BOOT, {"version": "1.0", "build": 7}),
+            audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-1"}),
+            audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-2"}),
+        ]
         
         # Verify chain
         is_valid, broken = audit.verify_chain()
         assert is_valid is True
         assert broken == []
+        assert [e.to_dict() for e in audit.get_entries()] == [e.to_dict() for e in logged]
     
     def test_chain_detection(self, tmp_path):
         """Test that chain tampering is detected."""
@@ -205,6 +416,183 @@ class TestAuditLogging:
         # Should detect tampering
         assert is_valid is False or len(broken) > 0
 
+    def test_incremental_verify_chain(self, tmp_path):
+        """Test that incremental verification resumes and still links."""
+        log_file = tmp_path / "test_audit.log"
+        audit = AuditLogger(device_id="test", log_path=log_file)
+        for i in range(5):
+            audit.log(AuditEventType.MESSAGE_DISPLAYED, {"n": i})
+        assert audit.verify_chain(incremental=True) == (True, [])
+        
+        for i in range(5, 8):
+            audit.log(AuditEventType.MESSAGE_DISPLAYED, {"n": i})
+        assert audit.verify_chain(incremental=True) == (True, [])
+        
+        # An appended entry that does not link on is caught
+        entry = json.loads(log_file.read_bytes().splitlines()[-1])
+        entry["sequence"] += 1
+        with open(log_file, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        is_valid, broken = audit.verify_chain(incremental=True)
+        assert is_valid is False and broken
+        
+        # Truncation below the checkpoint is a file-level error
+        log_file.write_text("")
+        assert audit.verify_chain(incremental=True) == (False, [-1])
+
+    def test_unexpected_fields_are_rejected(self, tmp_path):
+        """Test that an entry with extra keys does not load or verify."""
+        log_file = tmp_path / "test_audit.log"
+        audit = AuditLogger(device_id="test", log_path=log_file)
+        event = audit.log(AuditEventType.SYSTEM_BOOT, {"version": "1.0"})
+
+        assert AuditEvent.from_dict(event.to_dict()) == event
+        entry = dict(event.to_dict(), operator="mallory")
+        with pytest.raises(ValueError):
+            AuditEvent.from_dict(entry)
+
+        log_file.write_text(json.dumps(entry) + "\n")
+        is_valid, broken = AuditLogger(device_id="test", log_path=log_file).verify_chain()
+        assert is_valid is False and broken
+
+    def test_hash_preimage_is_canonical(self):
+        """Test that the assembled hash preimage matches canonical JSON."""
+        events = [
+            AuditEvent(1, "2024-01-01T00:00:00Z", "boot", "dev-\u00e9\"\\", {"v": [1.5, None]}, "0" * 64),
+            AuditEvent(2**70, "t", "x", "d", {}, "h"),
+            AuditEvent(True, None, "x", "d", {"k": "\u2603"}, "h"),
+        ]
+        for event in events:
+            payload = {
+                "sequence": event.sequence,
+                "timestamp": event.timestamp,
+                "event_type": event.event_type,
+                "device_id": event.device_id,
+                "data": event.data,
+                "previous_hash": event.previous_hash,
+            }
+            expected = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode()
+            assert event._hash_preimage() == expected
+
+    def test_chain_round_trips_unusual_values(self, tmp_path):
+        """Test that values the fast JSON parser mishandles still verify."""
+        log_file = tmp_path / "test_audit.log"
+        audit = AuditLogger(device_id="test", log_path=log_file)
+        audit.log(AuditEventType.DETECTION_EVENT, {"big": 2 ** 70, "neg": -2 ** 63 - 1})
+        audit.log(AuditEventType.DETECTION_EVENT, {"nan": float("nan"), "f": 0.1})
+
+        assert audit.verify_chain() == (True, [])
+        assert AuditLogger(device_id="test", log_path=log_file)._sequence == 2
+
+    def test_verify_segment(self, tmp_path):
+        """Test per-segment Merkle verification, across a restart."""
+        class SmallSegments(AuditLogger):
+            SEGMENT_SIZE = 4
+
+        log_file = tmp_path / "test_audit.log"
+        audit = SmallSegments(device_id="test", log_path=log_file)
+        for i in range(10):
+            audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": f"msg-{i}"})
+
+        assert audit.verify_segment(1) is True
+        assert audit.verify_segment(8) is True
+        assert audit.verify_segment(9) is False  # Not complete yet
+
+        audit = SmallSegments(device_id="test", log_path=log_file)
+        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-10"})
+        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-11"})
+        assert audit.verify_segment(12) is True
+
+        lines = log_file.read_text().split('\n')
+        entry = json.loads(lines[5])
+        entry["data"]["message_id"] = "HACKED"
+        lines[5] = json.dumps(entry)
+        log_file.write_text('\n'.join(lines))
+        assert audit.verify_segment(6) is False
+        assert audit.verify_segment(2) is True
+
+    def test_utc_now_iso_matches_isoformat(self, monkeypatch):
+        """Test the fast timestamp formatter against datetime.isoformat()."""
+        from cityarray.security import audit as audit_module
+
+        for ns in (1_700_000_000_123_456_789, 1_700_000_000_000_000_000, 951_782_400_000_001_000):
+            monkeypatch.setattr(audit_module.time, "time_ns", lambda ns=ns: ns)
+            expected = datetime.fromtimestamp(ns // 1000 / 1e6, timezone.utc)
+            expected = expected.replace(microsecond=ns // 1000 % 1_000_000)
+            assert audit_module._utc_now_iso() == expected.isoformat().replace('+00:00', 'Z')
+
+    def test_background_writes(self, tmp_path):
+        """Test that background writes keep the chain intact and in order."""
+        log_file = tmp_path / "test_audit.log"
+        audit = AuditLogger(device_id="test", log_path=log_file, background_writes=True)
+
+        for i in range(200):
+            audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": f"msg-{i}"})
+
+        is_valid, broken = audit.verify_chain()
+        assert is_valid is True
+        assert len(audit.get_entries(limit=1000)) == 200
+
+        audit.close()
+        assert AuditLogger(device_id="test", log_path=log_file)._sequence == 200
+
+    def test_log_after_close_with_background_writes(self, tmp_path):
+        """Test that entries logged after close() still reach the file."""
+        log_file = tmp_path / "test_audit.log"
+        audit = AuditLogger(device_id="test", log_path=log_file, background_writes=True)
+
+        audit.log(AuditEventType.SYSTEM_BOOT, {"version": "1.0"})
+        audit.close()
+        audit.close()  # Again, as atexit does
+        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-1"})
+        audit.flush()
+
+        assert len(log_file.read_text().splitlines()) == 2
+        assert audit.verify_chain() == (True, [])
+        assert AuditLogger(device_id="test", log_path=log_file)._sequence == 2
+
+    def test_flush_racing_close(self, tmp_path):
+        """Test that flush() never hangs when close() runs concurrently."""
+        for _ in range(20):
+            audit = AuditLogger(
+                device_id="test", log_path=tmp_path / "test_audit.log", background_writes=True
+            )
+            audit.log(AuditEventType.SYSTEM_BOOT, {"version": "1.0"})
+            flushers = [threading.Thread(target=audit.flush) for _ in range(4)]
+            for t in flushers:
+                t.start()
+            audit.close()
+            for t in flushers:
+                t.join(timeout=5)
+                assert not t.is_alive()
+
+    def test_closed_logger_is_released(self, tmp_path):
+        """Test that close() drops the atexit reference to a background logger."""
+        audit = AuditLogger(
+            device_id="test", log_path=tmp_path / "test_audit.log", background_writes=True
+        )
+        audit.close()
+        ref = weakref.ref(audit)
+        del audit
+        gc.collect()
+        assert ref() is None
+
+    def test_durable_writes(self, tmp_path):
+        """Test that durable writes reuse one descriptor and survive close()."""
+        log_file = tmp_path / "test_audit.log"
+        audit = AuditLogger(device_id="test", log_path=log_file, durable=True)
+
+        audit.log(AuditEventType.SYSTEM_BOOT, {"version": "1.0"})
+        fd = audit._fd
+        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-1"})
+        assert audit._fd == fd
+
+        audit.close()
+        assert audit._fd is None
+        audit.log(AuditEventType.MESSAGE_DISPLAYED, {"message_id": "msg-2"})
+        assert audit.verify_chain() == (True, [])
+        assert len(log_file.read_text().splitlines()) == 3
+
 
 class TestTierValidator:
     """Tests for tier validation."""
@@ -287,6 +675,72 @@ class TestTierValidator:
         )
         assert is_valid is True
 
+    def test_authorization_objects(self):
+        """Test validation of Authorization objects against allowed operators."""
+        validator = TierValidator(allowed_operators=["op-1", "op-2"])
+        auths = [Authorization("op-1", "2024-01-01"), Authorization("op-2", "2024-01-01")]
+
+        is_valid, error = validator.validate(AlertTier.EMERGENCY, "fire-evacuation", auths)
+        assert is_valid is True
+
+        auths.append(Authorization("op-9", "2024-01-01"))
+        is_valid, error = validator.validate(AlertTier.EMERGENCY, "fire-evacuation", auths)
+        assert is_valid is False
+        assert "op-9" in error
+
+
+class TestKeyStore:
+    """Tests for software key storage."""
+
+    def test_reopen_reuses_derived_key(self, tmp_path):
+        """Test that reopening a store reads its keys, and a wrong password cannot."""
+        store = SoftwareKeyStore(tmp_path, password="secret")
+        info = store.generate_signing_key("k1")
+
+        reopened = SoftwareKeyStore(tmp_path, password="secret")
+        assert reopened._encryption_key == store._encryption_key
+        assert reopened.get_public_key("k1").hex() == info.public_key_hex
+
+        signatures = reopened.sign_batch("k1", [b"a", b"b"])
+        assert signatures == [store.sign("k1", b"a"), store.sign("k1", b"b")]
+
+        wrong = SoftwareKeyStore(tmp_path, password="not-the-secret")
+        assert wrong._encryption_key != store._encryption_key
+        assert wrong.list_keys() == []
+
+    def test_keyring_entry_reveals_nothing_about_password(self, tmp_path, monkeypatch):
+        """Test that the keyring is keyed by store and checks the password."""
+        from cityarray.security import keys
+        
+        entries = {}
+        fake_keyring = type("FakeKeyring", (), {
+            "get_password": staticmethod(lambda service, name: entries.get(name)),
+            "set_password": staticmethod(
+                lambda service, name, value: entries.__setitem__(name, value)
+            ),
+        })
+        monkeypatch.setattr(keys, "keyring", fake_keyring, raising=False)
+        monkeypatch.setattr(keys, "KEYRING_AVAILABLE", True)
+        
+        store = SoftwareKeyStore(tmp_path, password="secret", reuse_kek=True)
+        store.generate_signing_key("k1")
+        salt = (tmp_path / ".salt").read_bytes()
+        assert list(entries) == [f"kek-{salt.hex()}"]
+        saved = dict(entries)
+        
+        # Neither the keyring nor the process cache stands in for a wrong
+        # password, and a wrong password does not replace their entries
+        wrong = SoftwareKeyStore(tmp_path, password="not-the-secret", reuse_kek=True)
+        assert wrong._encryption_key != store._encryption_key
+        assert wrong.list_keys() == []
+        assert entries == saved
+        
+        # A new process: nothing cached, and the keyring spares the KDF
+        keys._KEK_CACHE.clear()
+        monkeypatch.setattr(keys, "Scrypt", None)
+        reopened = SoftwareKeyStore(tmp_path, password="secret", reuse_kek=True)
+        assert reopened._encryption_key == store._encryption_key
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
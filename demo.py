@@ -5,6 +5,9 @@ Full demonstration for city officials
 
 import time
 import sys
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from led_simulator import LEDSimulator
 from hailo_detect import HailoDetector
 from city_data import CityData
@@ -12,6 +15,8 @@ from venues import VenueContext
 from scenarios import ScenarioPlayer, SCENARIOS
 from database import get_detection_summary
 
+CITY_DATA_REFRESH = 60  # Seconds between background city data refreshes
+
 class CityDemo:
     def __init__(self, venue_id="demo_site"):
         print("=== CITYARRAY City Demo ===\n")
@@ -26,18 +31,73 @@ class CityDemo:
         self.person_count = 0
         self.running = True
         
+        # Weather/AQI/NWS fetched in the background, so the display never
+        # waits on the network; show_* read whatever has arrived
+        self._pool = ThreadPoolExecutor(max_workers=3)
+        self._refresh_timer = None
+        self._refresh_city_data()
+        
+        # Queued messages as (text, color, show_until), in display order;
+        # _update_display() renders whichever is due each frame
+        self._display_queue = deque()
+        self._shown = None
+        
         print(f"Venue: {self.venue.venue['name']}")
         print(f"Languages: {', '.join(self.venue.get_languages())}")
         print("\nReady!\n")
     
+    def _refresh_city_data(self):
+        """Start fetching city data, and schedule the next refresh."""
+        try:
+            self._city_futures = {
+                "weather": self._pool.submit(self.city.get_weather),
+                "air_quality": self._pool.submit(self.city.get_air_quality),
+                "nws_alerts": self._pool.submit(self.city.get_nws_alerts),
+            }
+        except RuntimeError:
+            return  # Pool shut down by cleanup()
+        self._refresh_timer = threading.Timer(CITY_DATA_REFRESH, self._refresh_city_data)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _city_result(self, key):
+        """Latest fetched city data for key, or None if not in yet."""
+        try:
+            return self._city_futures[key].result(timeout=0.1)
+        except FutureTimeout:
+            return None
+    
     def show_message(self, text, color, duration=2):
-        """Display message with language rotation."""
-        self.display.clear()
+        """Queue a message for display after those already queued; returns immediately."""
         if len(text) > 10:
             text = text[:10]
-        self.display.draw_text_centered(text, color)
+        now = time.monotonic()
+        start = max(self._display_queue[-1][2], now) if self._display_queue else now
+        self._display_queue.append((text, color, start + duration))
+    
+    def _update_display(self):
+        """Render the queued message that is due now; the last one stays up."""
+        now = time.monotonic()
+        while self._display_queue and self._display_queue[0][2] <= now:
+            self._display_queue.popleft()
+        if self._display_queue and self._display_queue[0] is not self._shown:
+            text, color, _ = self._shown = self._display_queue[0]
+            self.display.clear()
+            self.display.draw_text_centered(text, color)
         self.display.render()
-        time.sleep(duration)
+    
+    def pause(self, seconds=0.0):
+        """
+        Keep the display and event pump running until queued messages have
+        been shown and at least `seconds` have passed.
+        """
+        deadline = time.monotonic() + seconds
+        while self.running and (self._display_queue or time.monotonic() < deadline):
+            if not self.display.process_events():
+                self.running = False
+                break
+            self._update_display()
+            self.display.tick(30)
     
     def show_scenario(self, scenario_id):
         """Play scenario with all languages."""
@@ -60,16 +120,15 @@ class CityDemo:
         for lang, msg in scenario["messages"].items():
             print(f"  [{lang}] {msg}")
             self.show_message(msg[:10], color, duration=1.5)
-            
-            if not self.display.process_events():
-                return
+        self.pause()
     
     def show_weather(self):
         """Display current weather."""
-        print("\nFetching weather...")
-        weather = self.city.get_weather()
-        
-        if "error" not in weather:
+        weather = self._city_result("weather")
+        if weather is None:
+            print("Weather: not available yet")
+            self.show_message("NO DATA", (0, 100, 255), duration=2)
+        elif "error" not in weather:
             msg = f"{weather['temp_f']}F {weather['conditions']}"
             print(f"Weather: {msg}")
             self.show_message(msg[:10], (0, 100, 255), duration=3)
@@ -78,10 +137,11 @@ class CityDemo:
     
     def show_air_quality(self):
         """Display air quality."""
-        print("\nFetching air quality...")
-        aqi = self.city.get_air_quality()
-        
-        if "error" not in aqi:
+        aqi = self._city_result("air_quality")
+        if aqi is None:
+            print("Air Quality: not available yet")
+            self.show_message("NO DATA", (0, 100, 255), duration=2)
+        elif "error" not in aqi:
             level = aqi["level"]
             print(f"Air Quality: {level}")
             
@@ -99,10 +159,11 @@ class CityDemo:
     
     def show_nws_alerts(self):
         """Display real NWS alerts."""
-        print("\nFetching NWS alerts...")
-        alerts = self.city.get_nws_alerts()
-        
-        if alerts and "error" not in alerts[0]:
+        alerts = self._city_result("nws_alerts")
+        if alerts is None:
+            print("NWS alerts: not available yet")
+            self.show_message("NO DATA", (0, 100, 255), duration=2)
+        elif alerts and "error" not in alerts[0]:
             for alert in alerts[:2]:
                 severity = alert["severity"]
                 event = alert["event"]
@@ -128,11 +189,12 @@ class CityDemo:
         """Run detection and count people."""
         dets = self.detector.detect(self.detector.capture(), conf_threshold=0.25)
         
-        self.person_count = sum(1 for d in dets if d['class'] == 'person')
+        # One pass: per-class counts, people included
+        classes = Counter(d['class'] for d in dets)
+        self.person_count = classes['person']
         
-        if dets:
-            objects = [d['class'] for d in dets]
-            print(f"Detected: {objects}")
+        if classes:
+            print(f"Detected: {dict(classes)}")
         
         # Show count
         capacity = self.venue.get_capacity()
@@ -160,24 +222,27 @@ class CityDemo:
         # 2. Detection
         print("\n2. Live detection...")
         self.detect_and_count()
-        time.sleep(1)
+        self.pause(1)
         
         # 3. Weather
         print("\n3. Weather data...")
         self.show_weather()
+        self.pause()
         
         # 4. Air Quality
         print("\n4. Air quality...")
         self.show_air_quality()
+        self.pause()
         
         # 5. NWS Alerts
         print("\n5. Real NWS alerts...")
         self.show_nws_alerts()
+        self.pause()
         
         # 6. Emergency Scenarios
         print("\n6. Emergency scenarios...")
         self.show_scenario("1")  # Earthquake
-        time.sleep(1)
+        self.pause(1)
         self.show_scenario("3")  # Fire
         
         # 7. All Clear
@@ -207,11 +272,14 @@ class CityDemo:
             if not self.display.process_events():
                 break
             
-            self.display.render()
+            self._update_display()
             self.display.tick(30)
     
     def cleanup(self):
         """Clean up resources."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
         self.display.quit()
         self.detector.close()
 
@@ -4,14 +4,22 @@ Detection → Database → Display loop
 """
 
 import time
+from operator import itemgetter
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from ultralytics import YOLO
-from database import log_detection, get_detection_summary
+from database import log_detections, get_detection_summary
 from templates import get_message_for_detection, get_status_message, get_supported_languages
 from led_simulator import LEDSimulator
 
+# Optional in-memory capture (Pi OS ships picamera2); falls back to rpicam-still
+try:
+    from picamera2 import Picamera2
+    PICAMERA2_AVAILABLE = True
+except ImportError:
+    PICAMERA2_AVAILABLE = False
+
 # Paths
 IMAGE_DIR = Path.home() / "pi" / "images"
 IMAGE_DIR.mkdir(exist_ok=True)
@@ -32,9 +40,29 @@ def capture_image():
     
     return image_path
 
-def detect_objects(image_path):
-    """Run YOLO detection."""
-    results = model.predict(str(image_path), save=False, verbose=False)
+_camera = None
+
+def capture_frame():
+    """
+    Capture a frame for detection.
+    
+    Returns a numpy array straight from picamera2 when available (no JPEG
+    encode, no disk), otherwise the path of an rpicam-still capture.
+    """
+    global _camera
+    if not PICAMERA2_AVAILABLE:
+        return capture_image()
+    if _camera is None:
+        _camera = Picamera2()
+        # "RGB888" is BGR in memory, the channel order YOLO expects for arrays
+        _camera.configure(_camera.create_still_configuration(main={"format": "RGB888"}))
+        _camera.start()
+    return _camera.capture_array()
+
+def detect_objects(source):
+    """Run YOLO detection on a frame array or an image path."""
+    image_path = None if hasattr(source, "shape") else str(source)
+    results = model.predict(image_path or source, save=False, verbose=False)
     
     detections = []
     for r in results:
@@ -44,15 +72,29 @@ def detect_objects(image_path):
                 "confidence": float(box.conf[0])
             }
             detections.append(obj)
-            log_detection(obj["class"], obj["confidence"], str(image_path))
     
+    if detections:
+        log_detections([(d["class"], d["confidence"]) for d in detections], image_path)
     return detections
 
+# (detection, language) -> (text cut to the panel width, tier, color)
+_message_cache = {}
+
+def detection_message(detection, lang, max_chars=10):
+    """Display text, tier and color for a detection, looked up once per language."""
+    key = (detection, lang)
+    message = _message_cache.get(key)
+    if message is None:
+        text, tier, color = get_message_for_detection(detection, lang)
+        message = _message_cache[key] = (text[:max_chars] if text else text, tier, color)
+    return message
+
 def run_agent():
     """Main agent loop."""
     sim = LEDSimulator()
     languages = get_supported_languages()
     lang_index = 0
+    scanning_messages = [get_status_message("scanning", lang) for lang in languages]
     
     # Show ready message
     text, tier, color = get_status_message("ready", "en")
@@ -80,12 +122,11 @@ def run_agent():
         # Scan for objects
         if current_time - last_scan > scan_interval:
             print("\nScanning...")
-            image_path = capture_image()
-            detections = detect_objects(image_path)
+            detections = detect_objects(capture_frame())
             
             if detections:
                 # Use highest confidence detection
-                best = max(detections, key=lambda d: d["confidence"])
+                best = max(detections, key=itemgetter("confidence"))
                 last_detection = best["class"]
                 last_detection_time = current_time
                 print(f"Detected: {best['class']} ({best['confidence']:.0%})")
@@ -103,17 +144,13 @@ def run_agent():
             
             if last_detection:
                 lang = languages[lang_index]
-                text, tier, color = get_message_for_detection(last_detection, lang)
+                text, tier, color = detection_message(last_detection, lang)
                 
                 if text:
-                    # Truncate if too long
-                    max_chars = 10
-                    if len(text) > max_chars:
-                        text = text[:max_chars]
                     sim.draw_text_centered(text, color)
                     print(f"Display [{lang}]: {text}")
             else:
-                text, tier, color = get_status_message("scanning", languages[lang_index])
+                text, tier, color = scanning_messages[lang_index]
                 sim.draw_text_centered(text, color)
             
             lang_index = (lang_index + 1) % len(languages)
@@ -123,6 +160,8 @@ def run_agent():
         sim.tick(30)
     
     sim.quit()
+    if _camera is not None:
+        _camera.stop()
     print("\nAgent stopped")
     print("\n=== Session Summary ===")
     for s in get_detection_summary():
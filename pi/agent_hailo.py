@@ -3,11 +3,24 @@ CITYARRAY Agent with Hailo Acceleration
 """
 
 import time
+from operator import itemgetter
 from hailo_detect import HailoDetector
 from database import get_detection_summary
 from templates import get_message_for_detection, get_status_message, get_supported_languages
 from led_simulator import LEDSimulator
 
+# (detection, language) -> (text cut to the panel width, tier, color)
+_message_cache = {}
+
+def detection_message(detection, lang, max_chars=10):
+    """Display text, tier and color for a detection, looked up once per language."""
+    key = (detection, lang)
+    message = _message_cache.get(key)
+    if message is None:
+        text, tier, color = get_message_for_detection(detection, lang)
+        message = _message_cache[key] = (text[:max_chars] if text else text, tier, color)
+    return message
+
 def run_agent():
     print("Starting CITYARRAY Agent (Hailo accelerated)...")
     
@@ -15,6 +28,7 @@ def run_agent():
     sim = LEDSimulator()
     languages = get_supported_languages()
     lang_index = 0
+    scanning_messages = [get_status_message("scanning", lang) for lang in languages]
     
     # Show ready
     text, tier, color = get_status_message("ready", "en")
@@ -44,7 +58,7 @@ def run_agent():
             dets = detector.detect(img, conf_threshold=0.25)
             
             if dets:
-                best = max(dets, key=lambda d: d["confidence"])
+                best = max(dets, key=itemgetter("confidence"))
                 last_detection = best["class"]
                 last_detection_time = current_time
                 print(f"Detected: {best['class']} ({best['confidence']:.0%})")
@@ -59,14 +73,11 @@ def run_agent():
             sim.clear()
             
             if last_detection:
-                lang = languages[lang_index]
-                text, tier, color = get_message_for_detection(last_detection, lang)
+                text, tier, color = detection_message(last_detection, languages[lang_index])
                 if text:
-                    if len(text) > 10:
-                        text = text[:10]
                     sim.draw_text_centered(text, color)
             else:
-                text, tier, color = get_status_message("scanning", languages[lang_index])
+                text, tier, color = scanning_messages[lang_index]
                 sim.draw_text_centered(text, color)
             
             lang_index = (lang_index + 1) % len(languages)
@@ -19,11 +19,25 @@ ESPEAK_VOICES = {
 def speak(text, lang="en"):
     """Speak text in specified language."""
     voice = ESPEAK_VOICES.get(lang, "en")
+    espeak = aplay = None
     try:
-        cmd = f'espeak -v {voice} "{text}" --stdout | aplay -D {DEVICE} -q'
-        subprocess.run(cmd, shell=True, timeout=30)
+        # espeak's WAV output piped straight into aplay, no shell in between.
+        # Text goes in on stdin, so it is never parsed as options or quoting.
+        espeak = subprocess.Popen(
+            ["espeak", "-v", voice, "--stdout"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        aplay = subprocess.Popen(["aplay", "-D", DEVICE, "-q"], stdin=espeak.stdout)
+        espeak.stdout.close()  # aplay holds the read end now
+        espeak.stdin.write(text.encode("utf-8"))
+        espeak.stdin.close()
+        aplay.wait(timeout=30)
+        espeak.wait(timeout=5)
         return True
     except Exception as e:
+        for proc in (espeak, aplay):
+            if proc is not None and proc.poll() is None:
+                proc.kill()
         print(f"TTS error: {e}")
         return False
 
@@ -92,6 +92,18 @@ def log_detection(object_class, confidence, image_path=None):
     
     return detection_id
 
+def log_detections(detections, image_path=None):
+    """Log several (object_class, confidence) detections in one transaction."""
+    timestamp = datetime.now().isoformat()
+    conn = get_connection()
+    with conn:
+        conn.executemany("""
+            INSERT INTO detections (timestamp, object_class, confidence, image_path)
+            VALUES (?, ?, ?, ?)
+        """, [(timestamp, object_class, confidence, image_path)
+              for object_class, confidence in detections])
+    conn.close()
+
 def get_recent_detections(limit=10):
     """Get recent detections."""
     conn = get_connection()
@@ -9,7 +9,7 @@ from PIL import Image
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from database import log_detection
+from database import log_detections
 
 COCO_NAMES = ["person","bicycle","car","motorcycle","airplane","bus","train","truck","boat","traffic light","fire hydrant","stop sign","parking meter","bench","bird","cat","dog","horse","sheep","cow","elephant","bear","zebra","giraffe","backpack","umbrella","handbag","tie","suitcase","frisbee","skis","snowboard","sports ball","kite","baseball bat","baseball glove","skateboard","surfboard","tennis racket","bottle","wine glass","cup","fork","knife","spoon","bowl","banana","apple","sandwich","orange","broccoli","carrot","hot dog","pizza","donut","cake","chair","couch","potted plant","bed","dining table","toilet","tv","laptop","mouse","remote","keyboard","cell phone","microwave","oven","toaster","sink","refrigerator","book","clock","vase","scissors","teddy bear","hair drier","toothbrush"]
 
@@ -43,16 +43,19 @@ class HailoDetector:
         detections = []
         raw = results["yolov8s/yolov8_nms_postprocess"][0]
         
+        # One (n, 5) array per class, already NMS'd on the Hailo; filter each
+        # class's confidence column in one numpy comparison
         for class_id, class_dets in enumerate(raw):
-            if len(class_dets) > 0:
-                for det in class_dets:
-                    if len(det) >= 5 and det[4] > conf_threshold:
-                        detections.append({
-                            "class": COCO_NAMES[class_id],
-                            "confidence": float(det[4])
-                        })
-                        log_detection(COCO_NAMES[class_id], float(det[4]), str(image_path))
+            class_dets = np.asarray(class_dets)
+            if class_dets.ndim != 2 or class_dets.shape[0] == 0 or class_dets.shape[1] < 5:
+                continue
+            confs = class_dets[:, 4]
+            name = COCO_NAMES[class_id]
+            for conf in confs[confs > conf_threshold].tolist():
+                detections.append({"class": name, "confidence": conf})
         
+        if detections:
+            log_detections([(d["class"], d["confidence"]) for d in detections], str(image_path))
         return detections
     
     def close(self):
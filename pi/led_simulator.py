@@ -72,14 +72,29 @@ class LEDSimulator:
         self.screen = pygame.display.set_mode((window_width, window_height))
         pygame.display.set_caption("CITYARRAY LED Simulator")
         
+        # Pixel buffer, allocated once; clear() and the drawing methods
+        # write into it in place
         self.pixels = [[(20, 20, 20) for _ in range(width)] for _ in range(height)]
         self.clock = pygame.time.Clock()
+        
+        # Screen geometry per pixel (rect, glow center), computed once
+        step = pixel_size + gap
+        self._cells = [
+            [((gap + x * step, gap + y * step, pixel_size, pixel_size),
+              (gap + x * step + pixel_size // 2, gap + y * step + pixel_size // 2))
+             for x in range(width)]
+            for y in range(height)
+        ]
+        self._glow_colors = {}
+        
+        # Last frame drawn; render() skips the redraw while it is unchanged
+        self._shown = None
     
     def clear(self, color=(20, 20, 20)):
         """Clear display."""
-        for y in range(self.height):
-            for x in range(self.width):
-                self.pixels[y][x] = color
+        row = [color] * self.width
+        for pixels_row in self.pixels:
+            pixels_row[:] = row
     
     def set_pixel(self, x, y, color):
         """Set single pixel."""
@@ -115,25 +130,33 @@ class LEDSimulator:
     
     def render(self):
         """Render to screen."""
-        self.screen.fill((0, 0, 0))
+        # The agents redraw the same frame at 30 fps; the window already
+        # shows it
+        if self.pixels == self._shown:
+            return
         
-        for y in range(self.height):
-            for x in range(self.width):
-                color = self.pixels[y][x]
-                px = self.gap + x * (self.pixel_size + self.gap)
-                py = self.gap + y * (self.pixel_size + self.gap)
-                
+        screen = self.screen
+        screen.fill((0, 0, 0))
+        glow_colors = self._glow_colors
+        radius = self.pixel_size
+        
+        for pixels_row, cells_row in zip(self.pixels, self._cells):
+            for color, (rect, center) in zip(pixels_row, cells_row):
                 # Glow effect
                 if color != (20, 20, 20):
-                    glow = tuple(c // 4 for c in color)
-                    pygame.draw.circle(self.screen, glow,
-                        (px + self.pixel_size // 2, py + self.pixel_size // 2),
-                        self.pixel_size)
+                    glow = glow_colors.get(color)
+                    if glow is None:
+                        glow = glow_colors[color] = tuple(c // 4 for c in color)
+                    pygame.draw.circle(screen, glow, center, radius)
                 
                 # Pixel
-                pygame.draw.rect(self.screen, color,
-                    (px, py, self.pixel_size, self.pixel_size),
-                    border_radius=2)
+                pygame.draw.rect(screen, color, rect, border_radius=2)
+        
+        if self._shown is None:
+            self._shown = [row[:] for row in self.pixels]
+        else:
+            for shown_row, pixels_row in zip(self._shown, self.pixels):
+                shown_row[:] = pixels_row
         
         pygame.display.flip()
     
@@ -0,0 +1,295 @@
+"""
+Tests for CITYARRAY City Data Integration
+"""
+
+import io
+import json
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add the repository root (where city_data.py lives) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import city_data
+from city_data import CityData
+
+
+class FakeClock:
+    """Stands in for time.monotonic; advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(city_data.time, "monotonic", fake)
+    return fake
+
+
+class FakeResponse:
+    """Minimal streamed requests response, usable as a context manager."""
+
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.raw = io.BytesIO(content)  # The undecoded stream, for ijson
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Returns canned responses in order and records each request's headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def wait_for_refresh(city, key, timeout=5.0):
+    """Block until the background refresh of key has finished."""
+    deadline = time.time() + timeout
+    while key in city._refreshing:
+        assert time.time() < deadline, "background refresh did not finish"
+        time.sleep(0.01)
+
+
+class TestStaleWhileRevalidate:
+    """Tests for CityData._cached."""
+
+    def test_fresh_value_is_served_from_cache(self, clock):
+        """Test that a value within its TTL is not fetched again."""
+        city = CityData(session=object())
+        calls = []
+
+        def fetch():
+            calls.append(clock.now)
+            return {"temp_f": 70}
+
+        assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 70}
+        clock.now += 599
+        assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 70}
+        assert len(calls) == 1
+
+    def test_stale_value_is_served_while_one_refresh_runs(self, clock):
+        """Test that stale reads return at once and share one background refresh."""
+        city = CityData(session=object())
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(threading.current_thread().name)
+            if len(calls) > 1:
+                release.wait(5)
+            return {"temp_f": 60 + len(calls)}
+
+        assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 61}
+        clock.now += 700  # Stale: past the TTL, within the grace period
+        for _ in range(5):
+            assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 61}
+        assert city._refreshing == {"weather"}
+
+        release.set()
+        wait_for_refresh(city, "weather")
+        assert len(calls) == 2
+        assert calls[1] != threading.current_thread().name
+        assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 62}
+
+    def test_expired_value_is_fetched_synchronously(self, clock):
+        """Test that a value past its grace period is fetched inline."""
+        city = CityData(session=object())
+        values = iter([{"temp_f": 61}, {"temp_f": 62}])
+
+        def fetch():
+            return next(values)
+
+        city._cached("weather", 600, 1800, fetch)
+        clock.now += 2401
+        assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 62}
+        assert city._refreshing == set()
+
+    def test_failures_are_not_cached(self, clock):
+        """Test that errors keep the last good value and are never cached."""
+        city = CityData(session=object())
+        results = iter([
+            {"temp_f": 61},
+            {"error": "timeout"},  # Background refreshes
+            {"error": "timeout"},
+            {"error": "timeout"},  # Synchronous fetch once expired
+            {"temp_f": 63},
+        ])
+
+        def fetch():
+            return next(results)
+
+        city._cached("weather", 600, 1800, fetch)
+        clock.now += 700
+        for _ in range(2):
+            assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 61}
+            wait_for_refresh(city, "weather")
+        # The failed refreshes left the stale value in place
+        assert city._cache["weather"].value == {"temp_f": 61}
+
+        clock.now += 1800  # Past the grace period
+        assert city._cached("weather", 600, 1800, fetch) == {"error": "timeout"}
+        assert city._cached("weather", 600, 1800, fetch) == {"temp_f": 63}
+        assert city._cache["weather"].value == {"temp_f": 63}
+
+    def test_alert_list_errors_are_not_cached(self, clock):
+        """Test that an alert-list error is returned but not cached."""
+        city = CityData(session=object())
+        results = iter([[{"error": "503"}], []])
+
+        def fetch():
+            return next(results)
+
+        assert city._cached("nws_alerts", 60, 300, fetch) == [{"error": "503"}]
+        assert "nws_alerts" not in city._cache
+        assert city._cached("nws_alerts", 60, 300, fetch) == []
+        assert city._cache["nws_alerts"].value == []
+
+
+class TestConditionalGet:
+    """Tests for CityData._get_json revalidation."""
+
+    URL = "https://api.example.test/data"
+
+    def test_not_modified_reuses_cached_body(self):
+        """Test that validators are sent and a 304 returns the previous result."""
+        session = FakeSession(
+            FakeResponse(200, b'{"temp": 70}', {
+                "ETag": '"v1"',
+                "Last-Modified": "Wed, 14 Oct 2026 10:00:00 GMT",
+            }),
+            FakeResponse(304),
+        )
+        city = CityData(session=session)
+        parsed = []
+
+        def parse(resp):
+            parsed.append(resp)
+            return city_data._json.loads(resp.content)
+
+        first = city._get_json(self.URL, parse)
+        second = city._get_json(self.URL, parse)
+
+        assert first == {"temp": 70}
+        assert second is first
+        assert len(parsed) == 1  # The 304 was neither read nor parsed
+
+        assert session.requests[0] == (self.URL, {})
+        assert session.requests[1] == (self.URL, {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 14 Oct 2026 10:00:00 GMT",
+        })
+
+    def test_changed_body_replaces_validators(self):
+        """Test that a new 200 replaces the stored body and validators."""
+        session = FakeSession(
+            FakeResponse(200, b'{"temp": 70}', {"ETag": '"v1"'}),
+            FakeResponse(200, b'{"temp": 72}', {"ETag": '"v2"'}),
+            FakeResponse(304),
+        )
+        city = CityData(session=session)
+
+        assert city._get_json(self.URL) == {"temp": 70}
+        assert city._get_json(self.URL) == {"temp": 72}
+        assert city._get_json(self.URL) == {"temp": 72}
+        assert session.requests[2][1] == {"If-None-Match": '"v2"'}
+
+    def test_no_validators_means_plain_requests(self):
+        """Test that responses without ETag/Last-Modified are not revalidated."""
+        session = FakeSession(
+            FakeResponse(200, b'{"temp": 70}'),
+            FakeResponse(200, b'{"temp": 71}'),
+        )
+        city = CityData(session=session)
+
+        city._get_json(self.URL)
+        assert city._get_json(self.URL) == {"temp": 71}
+        assert session.requests[1][1] == {}
+
+
+
+def nws_body(count):
+    """
+    NWS alerts GeoJSON with count features; every third omits its headline.
+    Descriptions are long, as in real alerts, so 40 features exceed one read.
+    """
+    features = []
+    for i in range(count):
+        props = {
+            "event": f"Event {i}",
+            "severity": "Severe",
+            "urgency": "Immediate",
+            "areaDesc": "Los Angeles",
+            "expires": "2026-10-15T12:00:00-07:00",
+            "description": "Take shelter. " * 300,
+        }
+        if i % 3:
+            props["headline"] = f"Headline {i}"
+        features.append({"id": str(i), "properties": props})
+    return json.dumps({"type": "FeatureCollection", "features": features}).encode()
+
+
+class TestNWSAlerts:
+    """Tests for _parse_nws_alerts."""
+
+    def expected(self, count):
+        return [
+            {
+                "event": f"Event {i}",
+                "headline": f"Headline {i}" if i % 3 else "",
+                "severity": "Severe",
+                "urgency": "Immediate",
+                "areas": "Los Angeles",
+                "expires": "2026-10-15T12:00:00-07:00",
+            }
+            for i in range(count)
+        ]
+
+    @pytest.mark.parametrize("count", [0, 3, 5, 40])
+    def test_fallback_parser(self, monkeypatch, count):
+        """Test the json path: at most _MAX_ALERTS alerts, fields mapped."""
+        monkeypatch.setattr(city_data, "IJSON_AVAILABLE", False)
+        resp = FakeResponse(200, nws_body(count))
+        assert city_data._parse_nws_alerts(resp) == self.expected(min(count, 5))
+
+    @pytest.mark.parametrize("count", [0, 3, 5, 40])
+    def test_streaming_parser(self, monkeypatch, count):
+        """Test the ijson path: same alerts, and the body is read to the end."""
+        ijson = pytest.importorskip("ijson")
+        monkeypatch.setattr(city_data, "ijson", ijson, raising=False)
+        monkeypatch.setattr(city_data, "IJSON_AVAILABLE", True)
+        body = nws_body(count)
+        resp = FakeResponse(200, body)
+        assert city_data._parse_nws_alerts(resp) == self.expected(min(count, 5))
+        assert resp.raw.decode_content is True
+        assert resp.raw.tell() == len(body)  # Drained for connection reuse
+
+    def test_empty_features(self, monkeypatch):
+        """Test that a null feature list means no alerts."""
+        monkeypatch.setattr(city_data, "IJSON_AVAILABLE", False)
+        resp = FakeResponse(200, b'{"features": null}')
+        assert city_data._parse_nws_alerts(resp) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])